@@ -7,20 +7,125 @@ import cv2
 import numpy as np
 import threading
 import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List, Dict, Callable, Tuple
 import subprocess
 import json
 
 
+ProcessorSettings = namedtuple(
+    'ProcessorSettings',
+    ['rotation_angle', 'flip_horizontal', 'flip_vertical', 'crop_region'])
+
+
 class ImageProcessor:
     """Handles real-time image processing operations"""
-    
+
+    # Rotation followed by flips forms the dihedral group of the square, so
+    # any (rotation, flip_h, flip_v) combination collapses to one of eight
+    # primitive transforms — almost all doable in a single OpenCV pass
+    # instead of chaining a rotate and a flip over the full frame.
+    # Keys: (rotation_angle, flip_horizontal, flip_vertical).
+    _COMPOSED_OPS = {
+        (0, False, False): 'identity',
+        (0, False, True): 'flip_v',
+        (0, True, False): 'flip_h',
+        (0, True, True): 'rot180',
+        (90, False, False): 'rot90',
+        (90, False, True): 'anti_transpose',
+        (90, True, False): 'transpose',
+        (90, True, True): 'rot270',
+        (180, False, False): 'rot180',
+        (180, False, True): 'flip_h',
+        (180, True, False): 'flip_v',
+        (180, True, True): 'identity',
+        (270, False, False): 'rot270',
+        (270, False, True): 'transpose',
+        (270, True, False): 'anti_transpose',
+        (270, True, True): 'rot90',
+    }
+
     def __init__(self):
         self.rotation_angle = 0  # 0, 90, 180, 270
         self.flip_horizontal = False
         self.flip_vertical = False
         self.crop_region = None  # (x, y, w, h) or None
-        
+
+        # Scale applied to preview frames; the GUI never shows full
+        # resolution, so 0.5 cuts preview bandwidth 4x
+        self.preview_scale = 0.5
+
+        # Reusable output buffers for rotate/flip, lazily sized to the
+        # incoming frame so per-frame allocations are avoided. Buffers are
+        # double-banked (ping-pong) so the frame produced by the previous
+        # call stays valid while the next one is being written
+        self._buffers: Dict[Tuple[str, int], np.ndarray] = {}
+        self._buffer_phase = 0
+
+        # Serializes plan execution: the live preview loop and capture
+        # workers both run process_frame, and without the lock they can
+        # toggle _buffer_phase concurrently and write the same bank
+        self._process_lock = threading.Lock()
+
+    # Settings are exposed as properties so any mutation — including the
+    # direct attribute assignments the GUI does — invalidates the cached
+    # processing plan and settings snapshot
+    _plan: Optional[Callable] = None
+    _settings_cache: Optional[ProcessorSettings] = None
+
+    def _invalidate_derived(self):
+        """Drop caches derived from the settings (plan, snapshot)"""
+        self._plan = None
+        self._settings_cache = None
+
+    @property
+    def rotation_angle(self) -> int:
+        return self._rotation_angle
+
+    @rotation_angle.setter
+    def rotation_angle(self, angle: int):
+        self._rotation_angle = angle
+        self._invalidate_derived()
+
+    @property
+    def flip_horizontal(self) -> bool:
+        return self._flip_horizontal
+
+    @flip_horizontal.setter
+    def flip_horizontal(self, value: bool):
+        self._flip_horizontal = value
+        self._invalidate_derived()
+
+    @property
+    def flip_vertical(self) -> bool:
+        return self._flip_vertical
+
+    @flip_vertical.setter
+    def flip_vertical(self, value: bool):
+        self._flip_vertical = value
+        self._invalidate_derived()
+
+    @property
+    def crop_region(self) -> Optional[Tuple[int, int, int, int]]:
+        return self._crop_region
+
+    @crop_region.setter
+    def crop_region(self, region: Optional[Tuple[int, int, int, int]]):
+        self._crop_region = region
+        self._invalidate_derived()
+
+    _use_opencl = False
+
+    @property
+    def use_opencl(self) -> bool:
+        return self._use_opencl
+
+    @use_opencl.setter
+    def use_opencl(self, value: bool):
+        self._use_opencl = value
+        self._invalidate_derived()
+
     def reset(self):
         """Reset all processing parameters"""
         self.rotation_angle = 0
@@ -56,52 +161,213 @@ class ImageProcessor:
         """Clear crop region"""
         self.crop_region = None
     
-    def process_frame(self, frame: np.ndarray) -> np.ndarray:
-        """Apply all processing operations to a frame"""
+    def process_frame(self, frame: np.ndarray,
+                      owned: bool = False) -> np.ndarray:
+        """Apply all processing operations to a frame
+
+        Note: when no operations are active the input frame is returned
+        as-is (no copy), so callers must treat the result as read-only.
+        With owned=True any result living in the pooled buffers is
+        copied out before the lock is released, giving the caller an
+        array no later call can overwrite.
+        """
         if frame is None:
             return None
-        
-        processed = frame.copy()
-        
-        # Apply rotation first
-        if self.rotation_angle == 90:
-            processed = cv2.rotate(processed, cv2.ROTATE_90_CLOCKWISE)
-        elif self.rotation_angle == 180:
-            processed = cv2.rotate(processed, cv2.ROTATE_180)
-        elif self.rotation_angle == 270:
-            processed = cv2.rotate(processed, cv2.ROTATE_90_COUNTERCLOCKWISE)
-        
-        # Apply flips
-        if self.flip_horizontal and self.flip_vertical:
-            processed = cv2.flip(processed, -1)  # Both axes
-        elif self.flip_horizontal:
-            processed = cv2.flip(processed, 1)   # Horizontal
-        elif self.flip_vertical:
-            processed = cv2.flip(processed, 0)   # Vertical
-        
-        # Apply crop last (after rotation, so crop coordinates match displayed image)
-        if self.crop_region:
-            x, y, w, h = self.crop_region
-            height, width = processed.shape[:2]
-            
-            # Ensure crop region is within bounds
-            x = max(0, min(x, width - 1))
-            y = max(0, min(y, height - 1))
-            w = max(1, min(w, width - x))
-            h = max(1, min(h, height - y))
-            
-            processed = processed[y:y+h, x:x+w]
-        
-        return processed
-    
+
+        plan = self._plan
+        if plan is None:
+            plan = self._rebuild_plan()
+        with self._process_lock:
+            result = plan(frame)
+            if owned and result is not frame:
+                result = result.copy()
+            return result
+
+    def _rebuild_plan(self) -> Callable[[np.ndarray], np.ndarray]:
+        """Compose the current settings into a cached per-frame callable
+
+        Settings change rarely relative to the 30 Hz frame rate, so the
+        branch structure is evaluated once here and process_frame just
+        invokes the resulting plan.
+        """
+        op = self._COMPOSED_OPS[(self.rotation_angle, self.flip_horizontal, self.flip_vertical)]
+
+        # Bind the crop rect into the closures now: the Tk thread can
+        # null crop_region between the capture thread fetching a plan
+        # and running it, and a plan must never re-read mutable settings
+        crop_rect = self.crop_region
+        crop_active = crop_rect is not None
+
+        if op != 'identity' and self.use_opencl and cv2.ocl.haveOpenCL():
+            # T-API path: the same ops run on the GPU via transparent
+            # OpenCL; worthwhile for large (e.g. 4K iPhone) frames where
+            # the CPU path is memory-bandwidth-bound
+            if crop_active:
+                def plan(frame):
+                    return self._apply_crop(self._apply_geometry_opencl(frame, op), crop_rect)
+            else:
+                def plan(frame):
+                    return self._apply_geometry_opencl(frame, op)
+            self._plan = plan
+            return plan
+
+        if op == 'identity' and not crop_active:
+            # Fast path: frame passes through untouched (read-only contract)
+            def plan(frame):
+                return frame
+        elif op == 'identity':
+            def plan(frame):
+                return self._apply_crop(frame, crop_rect)
+        elif not crop_active:
+            def plan(frame):
+                self._buffer_phase = 1 - self._buffer_phase
+                return self._apply_geometry(frame, op)
+        else:
+            def plan(frame):
+                self._buffer_phase = 1 - self._buffer_phase
+                # Fused path: map the crop back into source coordinates
+                # and transform only that slice, so the geometry op never
+                # touches pixels the crop would discard
+                src_rect = self._crop_source_rect(op, frame.shape, crop_rect)
+                x, y, w, h = src_rect
+                return self._apply_geometry(frame[y:y+h, x:x+w], op)
+
+        self._plan = plan
+        return plan
+
+    def _crop_source_rect(self, op: str, shape: Tuple,
+                          rect: Tuple) -> Tuple[int, int, int, int]:
+        """Pre-image of a crop rect under the composed transform
+
+        The crop is specified in output (displayed) coordinates; mapping
+        it through the inverse of the D4 op lets the plan slice the
+        source frame first and rotate/flip only the kept pixels — one
+        pass over the crop instead of one over the whole frame.
+        """
+        src_h, src_w = shape[:2]
+        if op in ('rot90', 'rot270', 'transpose', 'anti_transpose'):
+            out_w, out_h = src_h, src_w
+        else:
+            out_w, out_h = src_w, src_h
+
+        # Clamp in output coordinates, same rule as _apply_crop
+        x, y, w, h = rect
+        x = max(0, min(x, out_w - 1))
+        y = max(0, min(y, out_h - 1))
+        w = max(1, min(w, out_w - x))
+        h = max(1, min(h, out_h - y))
+
+        if op == 'flip_h':
+            return src_w - x - w, y, w, h
+        if op == 'flip_v':
+            return x, src_h - y - h, w, h
+        if op == 'rot180':
+            return src_w - x - w, src_h - y - h, w, h
+        if op == 'rot90':
+            return y, src_h - x - w, h, w
+        if op == 'rot270':
+            return src_w - y - h, x, h, w
+        if op == 'transpose':
+            return y, x, h, w
+        # anti_transpose
+        return src_w - y - h, src_h - x - w, h, w
+
+    def _apply_crop(self, processed: np.ndarray, rect: Tuple) -> np.ndarray:
+        """Slice out a crop rect, clamped to the frame bounds"""
+        x, y, w, h = rect
+        height, width = processed.shape[:2]
+
+        # Ensure crop region is within bounds
+        x = max(0, min(x, width - 1))
+        y = max(0, min(y, height - 1))
+        w = max(1, min(w, width - x))
+        h = max(1, min(h, height - y))
+
+        return processed[y:y+h, x:x+w]
+
+    def _apply_geometry(self, frame: np.ndarray, op: str) -> np.ndarray:
+        """Apply the composed rotation+flip transform in a single pass
+
+        All paths stay on OpenCV primitives on purpose: rot180 is a single
+        vectorized reverse-copy and the 90/270 cases use OpenCV's tiled
+        SIMD transpose, which a Python-side reimplementation cannot beat
+        without shipping a compiled extension.
+        """
+        if op == 'flip_h':
+            return cv2.flip(frame, 1, dst=self._get_buffer('geom', frame.shape, frame.dtype))
+        if op == 'flip_v':
+            return cv2.flip(frame, 0, dst=self._get_buffer('geom', frame.shape, frame.dtype))
+        if op == 'rot180':
+            return cv2.rotate(frame, cv2.ROTATE_180,
+                              dst=self._get_buffer('geom', frame.shape, frame.dtype))
+
+        swapped = self._rotated_shape(frame)
+        if op == 'rot90':
+            return cv2.rotate(frame, cv2.ROTATE_90_CLOCKWISE,
+                              dst=self._get_buffer('geom', swapped, frame.dtype))
+        if op == 'rot270':
+            return cv2.rotate(frame, cv2.ROTATE_90_COUNTERCLOCKWISE,
+                              dst=self._get_buffer('geom', swapped, frame.dtype))
+        if op == 'transpose':
+            return cv2.transpose(frame, dst=self._get_buffer('geom', swapped, frame.dtype))
+
+        # anti_transpose is the only element with no single OpenCV primitive;
+        # ROTATE_180 is a one-pass reverse-copy whereas flip(-1) runs one
+        # pass per axis
+        transposed = cv2.transpose(frame, dst=self._get_buffer('geom_tmp', swapped, frame.dtype))
+        return cv2.rotate(transposed, cv2.ROTATE_180,
+                          dst=self._get_buffer('geom', swapped, frame.dtype))
+
+    def _apply_geometry_opencl(self, frame: np.ndarray, op: str) -> np.ndarray:
+        """Run the composed transform on the GPU via cv2.UMat
+
+        The UMat wrap/unwrap costs a host<->device transfer each way, so
+        this path is only selected when use_opencl is explicitly enabled.
+        """
+        umat = cv2.UMat(frame)
+        if op == 'flip_h':
+            umat = cv2.flip(umat, 1)
+        elif op == 'flip_v':
+            umat = cv2.flip(umat, 0)
+        elif op == 'rot90':
+            umat = cv2.rotate(umat, cv2.ROTATE_90_CLOCKWISE)
+        elif op == 'rot180':
+            umat = cv2.rotate(umat, cv2.ROTATE_180)
+        elif op == 'rot270':
+            umat = cv2.rotate(umat, cv2.ROTATE_90_COUNTERCLOCKWISE)
+        elif op == 'transpose':
+            umat = cv2.transpose(umat)
+        else:  # anti_transpose
+            umat = cv2.rotate(cv2.transpose(umat), cv2.ROTATE_180)
+        # Crop is a trivial slice, done back on the host
+        return umat.get()
+
+    def _get_buffer(self, key: str, shape: Tuple, dtype) -> np.ndarray:
+        """Get a reusable output buffer, (re)allocating only on shape change"""
+        bank = (key, self._buffer_phase)
+        buf = self._buffers.get(bank)
+        if buf is None or buf.shape != shape or buf.dtype != dtype:
+            buf = np.empty(shape, dtype)
+            self._buffers[bank] = buf
+        return buf
+
+    @staticmethod
+    def _rotated_shape(frame: np.ndarray) -> Tuple:
+        """Output shape for a 90/270 degree rotation (swapped H and W)"""
+        return (frame.shape[1], frame.shape[0]) + frame.shape[2:]
+
+    def get_settings(self) -> ProcessorSettings:
+        """Get current settings as a cached immutable snapshot"""
+        settings = self._settings_cache
+        if settings is None:
+            settings = ProcessorSettings(self.rotation_angle, self.flip_horizontal,
+                                         self.flip_vertical, self.crop_region)
+            self._settings_cache = settings
+        return settings
+
     def get_settings_dict(self) -> Dict:
         """Get current settings as dictionary"""
-        return {
-            'rotation_angle': self.rotation_angle,
-            'flip_horizontal': self.flip_horizontal,
-            'flip_vertical': self.flip_vertical,
-            'crop_region': self.crop_region
-        }
+        return self.get_settings()._asdict()
     
     def load_settings_dict(self, settings: Dict):
         """Load settings from dictionary"""
@@ -114,32 +380,62 @@ class ImageProcessor:
 class CameraFeed:
     """Manages a single camera feed with live processing"""
     
-    def __init__(self, camera_index: int, name: str = "Camera"):
+    def __init__(self, camera_index: int, name: str = "Camera", native_yuv: bool = False,
+                 is_rgb: bool = False):
         self.camera_index = camera_index
         self.name = name
         self.camera = None
         self.is_active = False
         self.is_connected = False
         self.processor = ImageProcessor()
+
+        # Set for sources that already deliver RGB-ordered frames (some
+        # SDK-backed cameras); lets the display path skip the BGR2RGB swap
+        self.is_rgb = is_rgb
+
+        # With native_yuv the capture keeps the camera's raw NV12/YUV frames
+        # (half the bytes of BGR24) and defers the BGR conversion until a
+        # consumer actually asks for pixels
+        self.native_yuv = native_yuv
         
         # Threading for continuous capture
         self.capture_thread = None
         self.stop_capture = False
-        self.current_frame = None
-        self.processed_frame = None
-        self.frame_lock = threading.Lock()
+
+        # Ring buffer of (raw, processed) frame slots: the writer fills the
+        # slot after the latest published one, so consumers holding a slot
+        # reference have ring_size - 1 frames of grace before it is reused.
+        # The slabs are allocated lazily once the frame shape is known.
+        self.ring_size = 3
+        self._raw_ring = None
+        self._processed_ring = None
+        self._ring_latest = -1
+        self._frame_seq = 0
+
+        # Derived-format conversions (RGB, CHW float) computed at most once
+        # per captured frame and shared by all consumers
+        self._derived_cache: Dict[str, np.ndarray] = {}
+        self._derived_seq = -1
         
-        # Frame callbacks
+        # Frame callbacks: the list is the mutable registry, the tuple is
+        # an immutable snapshot the capture loop can iterate without
+        # racing concurrent add/remove calls
         self.frame_callbacks: List[Callable] = []
-        
+        self._callbacks_snapshot: Tuple[Callable, ...] = ()
+        self._callbacks_lock = threading.Lock()
+
     def add_frame_callback(self, callback: Callable):
         """Add callback function to be called when new frame is available"""
-        self.frame_callbacks.append(callback)
-    
+        with self._callbacks_lock:
+            self.frame_callbacks.append(callback)
+            self._callbacks_snapshot = tuple(self.frame_callbacks)
+
     def remove_frame_callback(self, callback: Callable):
         """Remove frame callback"""
-        if callback in self.frame_callbacks:
-            self.frame_callbacks.remove(callback)
+        with self._callbacks_lock:
+            if callback in self.frame_callbacks:
+                self.frame_callbacks.remove(callback)
+                self._callbacks_snapshot = tuple(self.frame_callbacks)
     
     def connect(self) -> bool:
         """Connect to the camera with improved settings for iPhone"""
@@ -153,6 +449,10 @@ class CameraFeed:
                 self.camera.set(cv2.CAP_PROP_FRAME_WIDTH, 1920)
                 self.camera.set(cv2.CAP_PROP_FRAME_HEIGHT, 1080)
                 self.camera.set(cv2.CAP_PROP_FPS, 30)
+                if self.native_yuv:
+                    # Skip the driver-side YUV->BGR conversion; frames
+                    # arrive as NV12 and are converted lazily on demand
+                    self.camera.set(cv2.CAP_PROP_CONVERT_RGB, 0)
                 
                 # Test frame capture with timeout
                 ret, frame = self.camera.read()
@@ -207,39 +507,156 @@ class CameraFeed:
     
     def _capture_loop(self):
         """Continuous capture loop running in separate thread"""
+        # read() already blocks at the camera's native rate; the deadline
+        # only throttles cameras that deliver faster than the target FPS
+        frame_interval = 1.0 / 30
+        next_deadline = time.monotonic() + frame_interval
+
         while not self.stop_capture and self.camera and self.camera.isOpened():
             ret, frame = self.camera.read()
             if ret:
-                with self.frame_lock:
-                    self.current_frame = frame.copy()
-                    self.processed_frame = self.processor.process_frame(frame)
-                
-                # Call frame callbacks
-                for callback in self.frame_callbacks:
-                    try:
-                        callback(self.processed_frame)
-                    except Exception as e:
-                        print(f"Error in frame callback: {e}")
-            
-            time.sleep(1/30)  # ~30 FPS
-    
-    def get_current_frame(self, processed: bool = True) -> Optional[np.ndarray]:
-        """Get the current frame"""
-        with self.frame_lock:
-            if processed:
-                return self.processed_frame.copy() if self.processed_frame is not None else None
+                # Process outside the lock: the OpenCV calls release the GIL
+                # and the processor double-banks its output buffers, so the
+                # previously published frame stays valid while this runs.
+                # In native_yuv mode the BGR conversion (and thus processing)
+                # is deferred until a consumer asks for pixels.
+                processed = None if self.native_yuv else self.processor.process_frame(frame)
+
+                slot = (self._ring_latest + 1) % self.ring_size
+                if (self._raw_ring is None
+                        or self._raw_ring.shape[1:] != frame.shape
+                        or self._raw_ring.dtype != frame.dtype):
+                    self._raw_ring = np.empty((self.ring_size,) + frame.shape, frame.dtype)
+                np.copyto(self._raw_ring[slot], frame)
+                if processed is not None:
+                    if (self._processed_ring is None
+                            or self._processed_ring.shape[1:] != processed.shape
+                            or self._processed_ring.dtype != processed.dtype):
+                        self._processed_ring = np.empty((self.ring_size,) + processed.shape, processed.dtype)
+                    np.copyto(self._processed_ring[slot], processed)
+
+                # Lock-free publish: single int stores are atomic in
+                # CPython, and only this thread ever writes them. Readers
+                # that see the new index also see the completed frame copy.
+                self._ring_latest = slot
+                self._frame_seq += 1
+
+                # Call frame callbacks (snapshot: lock-free and stable
+                # even if callbacks are added/removed mid-iteration)
+                if self._callbacks_snapshot:
+                    frame_out = (self.get_current_frame(copy=False)
+                                 if self.native_yuv else self._processed_ring[slot])
+                    for callback in self._callbacks_snapshot:
+                        try:
+                            callback(frame_out)
+                        except Exception as e:
+                            print(f"Error in frame callback: {e}")
+
+            sleep_for = next_deadline - time.monotonic()
+            if sleep_for > 0:
+                time.sleep(sleep_for)
+                next_deadline += frame_interval
             else:
-                return self.current_frame.copy() if self.current_frame is not None else None
+                # Camera is pacing us already; reset instead of accumulating debt
+                next_deadline = time.monotonic() + frame_interval
+    
+    def get_current_frame(self, processed: bool = True, copy: bool = True) -> Optional[np.ndarray]:
+        """Get the current frame
+
+        With copy=False the returned array is the ring-buffer slot itself:
+        read-only, and only valid until the slot is recycled (ring_size - 1
+        frames later). Suitable for consumers that immediately convert into
+        their own buffer.
+        """
+        slot = self._ring_latest
+        if slot < 0:
+            return None
+
+        if processed and self.native_yuv:
+            # Raw frames are YUV; decode + process lazily, once per tick
+            frame = self._get_derived_frame(
+                'native_processed',
+                lambda raw: self.processor.process_frame(
+                    cv2.cvtColor(raw, cv2.COLOR_YUV2BGR_NV12)),
+                from_processed=False)
+            if frame is None:
+                return None
+            return frame.copy() if copy else frame
+
+        ring = self._processed_ring if processed else self._raw_ring
+        if ring is None:
+            return None
+        frame = ring[slot]
+        return frame.copy() if copy else frame
     
+    def _get_derived_frame(self, key: str, convert: Callable[[np.ndarray], np.ndarray],
+                           from_processed: bool = True) -> Optional[np.ndarray]:
+        """Return a cached derived view of the latest frame
+
+        Conversions are computed once per captured frame and reused by all
+        consumers; the cache is dropped whenever a new frame is published.
+        """
+        if self._derived_seq != self._frame_seq:
+            self._derived_cache.clear()
+            self._derived_seq = self._frame_seq
+
+        derived = self._derived_cache.get(key)
+        if derived is None:
+            frame = self.get_current_frame(processed=from_processed, copy=False)
+            if frame is None:
+                return None
+            derived = convert(frame)
+            self._derived_cache[key] = derived
+        return derived
+
+    def get_rgb_frame(self) -> Optional[np.ndarray]:
+        """Latest processed frame as RGB (cached per tick, read-only)"""
+        return self._get_derived_frame(
+            'rgb', lambda frame: cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+
+    def get_chw_float_frame(self) -> Optional[np.ndarray]:
+        """Latest processed frame as contiguous CHW float32 in [0, 1]
+        (cached per tick, read-only) — the layout ML consumers expect"""
+        return self._get_derived_frame(
+            'chw_float',
+            lambda frame: np.ascontiguousarray(
+                frame.transpose(2, 0, 1), dtype=np.float32) / 255.0)
+
+    def get_preview_frame(self) -> Optional[np.ndarray]:
+        """Latest processed frame downsampled for GUI preview
+        (cached per tick, read-only); full resolution stays available
+        through get_current_frame for capture and recording"""
+        return self._get_derived_frame('preview', self._make_preview)
+
+    def _make_preview(self, frame: np.ndarray) -> np.ndarray:
+        """Downsample a frame by the processor's preview scale"""
+        scale = self.processor.preview_scale
+        if scale >= 1.0:
+            return frame
+        return cv2.resize(frame, None, fx=scale, fy=scale,
+                          interpolation=cv2.INTER_AREA)
+
     def capture_frame(self, processed: bool = True) -> Optional[np.ndarray]:
-        """Capture a single frame"""
+        """Capture a single frame the caller owns outright
+
+        process_frame can return one of the processor's pooled
+        ping-pong buffers, which the live preview loop keeps rewriting
+        at frame rate on its own thread — so the processed result is
+        requested as an owned copy. Without it a captured frame can be
+        torn or silently replaced by a later preview frame before the
+        caller encodes it.
+        """
         if not self.is_active or not self.camera:
             return None
-        
+
         ret, frame = self.camera.read()
         if ret:
             if processed:
-                return self.processor.process_frame(frame)
+                if self.native_yuv:
+                    # read() hands back raw NV12 here; convert to BGR
+                    # before processing, as get_current_frame does lazily
+                    frame = cv2.cvtColor(frame, cv2.COLOR_YUV2BGR_NV12)
+                return self.processor.process_frame(frame, owned=True)
             else:
                 return frame
         return None
@@ -264,52 +681,87 @@ class CameraFeed:
 class CameraManager:
     """Manages multiple cameras and their feeds"""
     
+    # How long subprocess-backed lookups (system_profiler/ffmpeg) stay cached
+    CACHE_TTL = 60.0
+
     def __init__(self):
         self.available_cameras = []
         self.camera_feeds: Dict[str, CameraFeed] = {}
+
+        # (timestamp, result) caches for the slow subprocess/probe lookups
+        self._camera_names_cache: Optional[Tuple[float, Dict[int, str]]] = None
+        self._iphone_camera_cache: Optional[Tuple[float, Optional[int]]] = None
+
         self.detect_cameras()
+
+    def invalidate_caches(self):
+        """Drop cached subprocess/probe results so the next lookup re-runs"""
+        self._camera_names_cache = None
+        self._iphone_camera_cache = None
     
     def detect_cameras(self, max_cameras: int = 20) -> List[int]:
         """Detect available cameras with improved iPhone detection"""
-        available = []
         print(f"Detecting cameras (0-{max_cameras-1})...")
-        
-        for i in range(max_cameras):
-            try:
-                print(f"Testing camera {i}...")
-                cap = cv2.VideoCapture(i, cv2.CAP_AVFOUNDATION)
-                
-                if cap.isOpened():
-                    # Set buffer size to prevent lag
-                    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
-                    
-                    # Try to read a frame with timeout
-                    ret, frame = cap.read()
-                    if ret and frame is not None:
-                        width = cap.get(cv2.CAP_PROP_FRAME_WIDTH)
-                        height = cap.get(cv2.CAP_PROP_FRAME_HEIGHT)
-                        backend = cap.getBackendName()
-                        
-                        print(f"Camera {i}: {width}x{height} ({backend})")
-                        available.append(i)
-                    else:
-                        print(f"Camera {i}: No frame data")
-                    
-                    cap.release()
-                else:
-                    print(f"Camera {i}: Failed to open")
-                    
-            except Exception as e:
-                print(f"Camera {i}: Exception - {e}")
-        
+
+        # Probes are independent I/O waits, so run them concurrently
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(self._probe_camera, range(max_cameras)))
+
+        available = [index for index, dims in sorted(results) if dims is not None]
+
         print(f"Found cameras: {available}")
         self.available_cameras = available
+        self.invalidate_caches()
         return available
+
+    @staticmethod
+    def _probe_camera(index: int) -> Tuple[int, Optional[Tuple[float, float]]]:
+        """Probe a single camera index, returning (index, (width, height) or None)"""
+        try:
+            print(f"Testing camera {index}...")
+            cap = cv2.VideoCapture(index, cv2.CAP_AVFOUNDATION)
+
+            if cap.isOpened():
+                # Set buffer size to prevent lag
+                cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+                # Try to read a frame with timeout
+                ret, frame = cap.read()
+                if ret and frame is not None:
+                    width = cap.get(cv2.CAP_PROP_FRAME_WIDTH)
+                    height = cap.get(cv2.CAP_PROP_FRAME_HEIGHT)
+                    backend = cap.getBackendName()
+
+                    print(f"Camera {index}: {width}x{height} ({backend})")
+                    cap.release()
+                    return index, (width, height)
+                else:
+                    print(f"Camera {index}: No frame data")
+
+                cap.release()
+            else:
+                print(f"Camera {index}: Failed to open")
+
+        except Exception as e:
+            print(f"Camera {index}: Exception - {e}")
+
+        return index, None
     
     def detect_iphone_camera(self) -> Optional[int]:
         """Enhanced iPhone Continuity Camera detection"""
+        if self._iphone_camera_cache is not None:
+            cached_at, cached_index = self._iphone_camera_cache
+            if time.monotonic() - cached_at < self.CACHE_TTL:
+                return cached_index
+
+        index = self._detect_iphone_camera_uncached()
+        self._iphone_camera_cache = (time.monotonic(), index)
+        return index
+
+    def _detect_iphone_camera_uncached(self) -> Optional[int]:
+        """Run the actual ffmpeg/probe-based iPhone detection"""
         print("Searching for iPhone Continuity Camera...")
-        
+
         try:
             # Method 1: Use ffmpeg to list AVFoundation devices
             result = subprocess.run([
@@ -351,30 +803,19 @@ class CameraManager:
                         except Exception as e:
                             print(f"Error parsing iPhone camera index: {e}")
             
-            # Method 2: Check higher indices systematically
+            # Method 2: Check higher indices concurrently
             print("\nTesting high-resolution cameras (potential iPhone)...")
-            for i in range(2, 15):
-                try:
-                    cap = cv2.VideoCapture(i, cv2.CAP_AVFOUNDATION)
-                    if cap.isOpened():
-                        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
-                        ret, frame = cap.read()
-                        
-                        if ret and frame is not None:
-                            width = cap.get(cv2.CAP_PROP_FRAME_WIDTH)
-                            height = cap.get(cv2.CAP_PROP_FRAME_HEIGHT)
-                            
-                            print(f"Camera {i}: {width}x{height}")
-                            
-                            # iPhone cameras typically have high resolution
-                            if width >= 1920 and height >= 1080:
-                                cap.release()
-                                return i
-                        
-                        cap.release()
-                except Exception as e:
-                    continue
-                            
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(executor.map(self._probe_camera, range(2, 15)))
+
+            for i, dims in sorted(results):
+                if dims is not None:
+                    width, height = dims
+                    # iPhone cameras typically have high resolution
+                    if width >= 1920 and height >= 1080:
+                        return i
+
+
         except Exception as e:
             print(f"Error in iPhone detection: {e}")
         
@@ -383,8 +824,19 @@ class CameraManager:
     
     def get_camera_names(self) -> Dict[int, str]:
         """Get camera names using system_profiler"""
+        if self._camera_names_cache is not None:
+            cached_at, cached_names = self._camera_names_cache
+            if time.monotonic() - cached_at < self.CACHE_TTL:
+                return cached_names
+
+        camera_names = self._get_camera_names_uncached()
+        self._camera_names_cache = (time.monotonic(), camera_names)
+        return camera_names
+
+    def _get_camera_names_uncached(self) -> Dict[int, str]:
+        """Query system_profiler for camera display names"""
         camera_names = {}
-        
+
         try:
             result = subprocess.run([
                 'system_profiler', 'SPCameraDataType', '-json'
@@ -412,17 +864,49 @@ class CameraManager:
         if camera_index not in self.available_cameras:
             # Try to add it anyway (for iPhone camera)
             print(f"Warning: Camera {camera_index} not in detected cameras, trying anyway...")
-        
-        camera_names = self.get_camera_names()
-        camera_name = camera_names.get(camera_index, f"Camera {camera_index}")
-        
-        feed = CameraFeed(camera_index, camera_name)
+
+        # Feed creation is latency-sensitive (it sits on the connect click),
+        # so start with a generic name and resolve the display name in the
+        # background rather than waiting on system_profiler here
+        feed = CameraFeed(camera_index, f"Camera {camera_index}")
         self.camera_feeds[feed_name] = feed
+        threading.Thread(target=self._resolve_feed_name, args=(feed,), daemon=True).start()
         return feed
+
+    def _resolve_feed_name(self, feed: CameraFeed):
+        """Update a feed's display name once camera names are available"""
+        try:
+            name = self.get_camera_names().get(feed.camera_index)
+        except Exception as e:
+            print(f"Error resolving camera name: {e}")
+            return
+        if name:
+            feed.name = name
     
     def get_feed(self, feed_name: str) -> Optional[CameraFeed]:
         """Get camera feed by name"""
         return self.camera_feeds.get(feed_name)
+
+    def capture_synchronized(self, processed: bool = True) -> Dict[str, Optional[np.ndarray]]:
+        """Capture one frame from every connected feed with minimal skew
+
+        read() does grab+retrieve+decode atomically, so sequential read()
+        calls offset the cameras by a full decode each. Instead, grab() on
+        every camera first — a cheap sensor latch — then retrieve()/decode
+        afterwards, which also lets the decodes overlap since retrieve()
+        releases the GIL.
+        """
+        connected = [(name, feed) for name, feed in self.camera_feeds.items()
+                     if feed.is_connected and feed.camera is not None]
+
+        grabbed = [(name, feed) for name, feed in connected if feed.camera.grab()]
+
+        frames: Dict[str, Optional[np.ndarray]] = {name: None for name, _ in connected}
+        for name, feed in grabbed:
+            ret, frame = feed.camera.retrieve()
+            if ret and frame is not None:
+                frames[name] = feed.processor.process_frame(frame) if processed else frame
+        return frames
     
     def remove_feed(self, feed_name: str):
         """Remove and cleanup camera feed"""
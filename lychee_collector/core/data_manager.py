@@ -3,17 +3,125 @@ Data Management Module
 Handles sample data storage, retrieval, and management
 """
 
+import atexit
 import csv
 import json
 import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Optional, Any
+import numpy as np
 import pandas as pd
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pacsv = None
+    pq = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import fcntl
+    FICLONE = 0x40049409  # Linux copy-on-write clone ioctl
+except ImportError:
+    fcntl = None
+
+
+def _dumps_record(record: Dict[str, Any]) -> str:
+    """Serialize one backup record, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    return json.dumps(record, ensure_ascii=False)
+
+
+def _loads_record(line: str) -> Dict[str, Any]:
+    """Parse one backup record, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
+
+
+def _parquet_schema():
+    """Fixed schema for the Parquet mirror of the metadata CSV"""
+    return pa.schema([
+        ('sample_id', pa.string()),
+        ('lychee_variation', pa.dictionary(pa.int32(), pa.string())),
+        ('days_after_picked', pa.int16()),
+        ('sugar_content', pa.float32()),
+        ('acid_content', pa.float32()),
+        ('pH', pa.float32()),
+        ('sugar_acid_ratio', pa.float32()),
+        ('notes', pa.string()),
+        ('timestamp', pa.string()),
+        ('rgb_image', pa.string()),
+        ('nir_image', pa.string()),
+        ('rgb_processing_settings', pa.string()),
+        ('nir_processing_settings', pa.string()),
+    ])
+
+
+def _parquet_row(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Coerce a sample dictionary to the Parquet mirror schema"""
+    def _number(value, cast):
+        try:
+            if value is None or value == '' or value != value:
+                return None
+            return cast(value)
+        except (ValueError, TypeError):
+            return None
+
+    def _text(value):
+        if value is None or (isinstance(value, float) and value != value):
+            return None
+        if isinstance(value, (dict, list)):
+            return json.dumps(value)
+        return str(value)
+
+    return {
+        'sample_id': _text(data.get('sample_id')),
+        'lychee_variation': _text(data.get('lychee_variation')),
+        'days_after_picked': _number(data.get('days_after_picked'),
+                                     lambda v: int(float(v))),
+        'sugar_content': _number(data.get('sugar_content'), float),
+        'acid_content': _number(data.get('acid_content'), float),
+        'pH': _number(data.get('pH'), float),
+        'sugar_acid_ratio': _number(data.get('sugar_acid_ratio'), float),
+        'notes': _text(data.get('notes')),
+        'timestamp': _text(data.get('timestamp')),
+        'rgb_image': _text(data.get('rgb_image')),
+        'nir_image': _text(data.get('nir_image')),
+        'rgb_processing_settings': _text(data.get('rgb_processing_settings')),
+        'nir_processing_settings': _text(data.get('nir_processing_settings')),
+    }
+
 
 class SampleData:
-    """Represents a single lychee sample with all its data"""
-    
+    """Represents a single lychee sample with all its data
+
+    Uses __slots__: one instance is created per CSV row in bulk loads,
+    and slots roughly halve the per-instance memory while speeding up
+    attribute access.
+    """
+
+    # CSV column order; the single place the metadata schema is defined
+    FIELDNAMES = ('sample_id', 'lychee_variation', 'days_after_picked',
+                  'sugar_content', 'acid_content', 'pH', 'sugar_acid_ratio',
+                  'notes', 'timestamp', 'rgb_image', 'nir_image',
+                  'rgb_processing_settings', 'nir_processing_settings')
+
+    __slots__ = ('sample_id', 'lychee_variation', 'days_after_picked',
+                 'sugar_content', 'acid_content', 'ph', 'sugar_acid_ratio',
+                 'notes', 'timestamp', 'rgb_image', 'nir_image',
+                 '_rgb_processing_settings', '_nir_processing_settings')
+
     def __init__(self, sample_id: str = None):
         self.sample_id = sample_id
         self.lychee_variation = ""
@@ -26,9 +134,43 @@ class SampleData:
         self.timestamp = None
         self.rgb_image = None
         self.nir_image = None
-        self.rgb_processing_settings = None
-        self.nir_processing_settings = None
-    
+        self._rgb_processing_settings = None
+        self._nir_processing_settings = None
+
+    @staticmethod
+    def _decode_settings(value):
+        """Decode a raw settings value; JSON strings parse on demand"""
+        if isinstance(value, str):
+            try:
+                return json.loads(value)
+            except ValueError:
+                return None
+        if isinstance(value, float):  # NaN placeholder from pandas
+            return None
+        return value
+
+    @property
+    def rgb_processing_settings(self):
+        """RGB processing settings, JSON-decoded on first access"""
+        value = self._decode_settings(self._rgb_processing_settings)
+        self._rgb_processing_settings = value
+        return value
+
+    @rgb_processing_settings.setter
+    def rgb_processing_settings(self, value):
+        self._rgb_processing_settings = value
+
+    @property
+    def nir_processing_settings(self):
+        """NIR processing settings, JSON-decoded on first access"""
+        value = self._decode_settings(self._nir_processing_settings)
+        self._nir_processing_settings = value
+        return value
+
+    @nir_processing_settings.setter
+    def nir_processing_settings(self, value):
+        self._nir_processing_settings = value
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
         return {
@@ -112,12 +254,45 @@ class DataManager:
     def __init__(self, data_directory: str = "organized/lychee_dataset"):
         self.data_directory = data_directory
         self.csv_file = os.path.join(data_directory, "metadata_extended.csv")
-        self.json_backup_file = os.path.join(data_directory, "samples_backup.json")
+        self.parquet_file = os.path.join(data_directory, "metadata_extended.parquet")
+        self.json_backup_file = os.path.join(data_directory, "samples_backup.jsonl")
         self.rgb_image_dir = os.path.join(data_directory, "images", "rgb")
         self.nir_image_dir = os.path.join(data_directory, "images", "nir")
-        
+
+        # Parquet mirror writer, opened lazily on first save
+        self._parquet_writer = None
+        self._parquet_arrow_schema = None
+
+        # Parsed-metadata cache, invalidated when the CSV mtime changes
+        self._df_cache = {'mtime': None, 'df': None, 'sample_ids': None,
+                          'id_index': None}
+
+        # Persistent sample-ID counter, loaded lazily
+        self._next_id_file = os.path.join(data_directory, ".next_id")
+        self._next_id = None
+
+        # Soft-deleted sample IDs (tombstones), loaded lazily
+        self._deleted_file = os.path.join(data_directory, "deleted.txt")
+        self._deleted_ids = None
+
+        # Write buffer: staged CSV rows and JSONL backup records,
+        # flushed together in batches
+        self._pending: List[Dict[str, Any]] = []
+        self._backup_pending: List[Dict[str, Any]] = []
+        self._flush_every = 32
+
         # Ensure directories exist
         self._create_directories()
+
+        atexit.register(self.close)
+
+    def close(self):
+        """Flush buffered writes and close the Parquet mirror writer"""
+        self.flush()
+        self._compact_json_backup()
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+            self._parquet_writer = None
     
     def _create_directories(self):
         """Create necessary directories"""
@@ -125,35 +300,175 @@ class DataManager:
         os.makedirs(self.rgb_image_dir, exist_ok=True)
         os.makedirs(self.nir_image_dir, exist_ok=True)
     
+    def _csv_mtime(self) -> Optional[int]:
+        """Get the metadata CSV mtime in nanoseconds, or None if missing"""
+        try:
+            return os.stat(self.csv_file).st_mtime_ns
+        except OSError:
+            return None
+
+    def _get_df(self) -> Optional[pd.DataFrame]:
+        """Get the metadata DataFrame, re-parsing only when the CSV changed
+
+        Repeated reads within a session are served from memory; the cache
+        is keyed on the file mtime so external edits are still picked up.
+        Callers must not mutate the returned DataFrame.
+        """
+        mtime = self._csv_mtime()
+        if mtime is None:
+            return None
+
+        cache = self._df_cache
+        if cache['mtime'] != mtime:
+            df = self._read_csv()
+
+            # Filter out tombstoned rows
+            deleted = self._get_deleted_ids()
+            if deleted and 'sample_id' in df.columns:
+                df = df[~df['sample_id'].isin(deleted)]
+
+            cache['df'] = df
+            cache['sample_ids'] = None
+            cache['id_index'] = None
+            cache['mtime'] = mtime
+
+        return cache['df']
+
+    def _get_deleted_ids(self) -> set:
+        """Tombstoned sample IDs, loaded once per session"""
+        if self._deleted_ids is None:
+            self._deleted_ids = set()
+            if os.path.exists(self._deleted_file):
+                try:
+                    with open(self._deleted_file, 'r') as f:
+                        self._deleted_ids = {line.strip() for line in f
+                                             if line.strip()}
+                except OSError as e:
+                    print(f"Error reading deleted-IDs file: {e}")
+
+        return self._deleted_ids
+
+    def _get_id_index(self) -> Dict[str, int]:
+        """Map sample IDs to row positions in the cached DataFrame
+
+        Turns per-ID lookups into a dict hit instead of a column scan.
+        The first row per ID wins, matching the old filter-then-iloc[0]
+        behavior. Rebuilt whenever the CSV is re-parsed.
+        """
+        df = self._get_df()  # may invalidate the index on re-parse
+
+        cache = self._df_cache
+        if cache['id_index'] is None:
+            index = {}
+            if df is not None and 'sample_id' in df.columns:
+                for position, sample_id in enumerate(df['sample_id'].tolist()):
+                    if sample_id not in index:
+                        index[sample_id] = position
+            cache['id_index'] = index
+
+        return cache['id_index']
+
+    def _read_csv(self) -> pd.DataFrame:
+        """Parse the metadata CSV, preferring pyarrow's parallel reader
+
+        pyarrow.csv parses across CPU cores and is several times faster
+        than pandas on cold reads; text columns are pinned to strings so
+        timestamps and settings blobs come back unparsed, matching the
+        pandas fallback.
+        """
+        if pacsv is not None:
+            try:
+                text_columns = ('sample_id', 'lychee_variation', 'notes',
+                                'timestamp', 'rgb_image', 'nir_image',
+                                'rgb_processing_settings',
+                                'nir_processing_settings')
+                table = pacsv.read_csv(
+                    self.csv_file,
+                    convert_options=pacsv.ConvertOptions(
+                        column_types={name: pa.string() for name in text_columns},
+                        strings_can_be_null=True))
+                return table.to_pandas()
+            except Exception as e:
+                print(f"Error reading CSV with pyarrow: {e}")
+
+        return pd.read_csv(self.csv_file)
+
     def get_next_sample_id(self) -> str:
         """Get the next available sample ID"""
-        existing_samples = self.get_all_sample_ids()
-        
-        if not existing_samples:
-            return "sample_001"
-        
+        return f"sample_{self._get_next_id_number():03d}"
+
+    def _get_next_id_number(self) -> int:
+        """Get the next free numeric sample ID without scanning the CSV
+
+        The counter persists in a hidden file next to the CSV, so ID
+        allocation is O(1); the full ID scan only runs once to seed the
+        counter when that file does not exist yet.
+        """
+        if self._next_id is not None:
+            return self._next_id
+
+        try:
+            with open(self._next_id_file, 'r') as f:
+                self._next_id = int(f.read().strip())
+            return self._next_id
+        except (OSError, ValueError):
+            pass
+
         # Extract numeric parts and find the maximum
         max_num = 0
-        for sample_id in existing_samples:
-            if sample_id.startswith('sample_'):
+        for sample_id in self.get_all_sample_ids():
+            if isinstance(sample_id, str) and sample_id.startswith('sample_'):
                 try:
                     num = int(sample_id.replace('sample_', ''))
                     max_num = max(max_num, num)
                 except ValueError:
                     continue
-        
-        return f"sample_{max_num + 1:03d}"
+
+        self._next_id = max_num + 1
+        return self._next_id
+
+    def _advance_next_id(self, sample_id: Optional[str], persist: bool = True):
+        """Bump the persisted ID counter past a newly saved sample"""
+        if not (isinstance(sample_id, str) and sample_id.startswith('sample_')):
+            return
+
+        try:
+            num = int(sample_id.replace('sample_', ''))
+        except ValueError:
+            return
+
+        if num >= self._get_next_id_number():
+            self._next_id = num + 1
+
+        if persist:
+            self._persist_next_id()
+
+    def _persist_next_id(self):
+        """Atomically rewrite the ID counter file"""
+        try:
+            tmp_file = self._next_id_file + '.tmp'
+            with open(tmp_file, 'w') as f:
+                f.write(str(self._next_id))
+            os.replace(tmp_file, self._next_id_file)
+        except OSError as e:
+            print(f"Error persisting sample ID counter: {e}")
     
     def get_all_sample_ids(self) -> List[str]:
         """Get all existing sample IDs"""
+        self.flush()
+
         if not os.path.exists(self.csv_file):
             return []
         
         sample_ids = []
         try:
-            df = pd.read_csv(self.csv_file)
-            if 'sample_id' in df.columns:
-                sample_ids = df['sample_id'].tolist()
+            df = self._get_df()
+            if self._df_cache['sample_ids'] is None:
+                if df is not None and 'sample_id' in df.columns:
+                    self._df_cache['sample_ids'] = df['sample_id'].tolist()
+                else:
+                    self._df_cache['sample_ids'] = []
+            sample_ids = list(self._df_cache['sample_ids'])
         except Exception as e:
             print(f"Error reading CSV file: {e}")
             # Fallback to manual CSV reading
@@ -169,7 +484,13 @@ class DataManager:
         return sample_ids
     
     def save_sample(self, sample: SampleData) -> bool:
-        """Save a sample to storage"""
+        """Save a sample to storage and flush it to disk
+
+        Interactive saves report success to the user, so the row and
+        its backup record go to disk before returning — buffering is
+        only worthwhile on the batch path, where save_samples already
+        flushes once per call.
+        """
         try:
             # Calculate ratio if needed
             sample.calculate_sugar_acid_ratio()
@@ -178,100 +499,235 @@ class DataManager:
             if not sample.timestamp:
                 sample.timestamp = datetime.now().isoformat()
             
+            # Mirror to Parquet first: the lazily-opened writer seeds
+            # itself from the CSV as it exists before this save
+            self._save_to_parquet(sample)
+
             # Save to CSV
             self._save_to_csv(sample)
-            
+
             # Save to JSON backup
             self._save_to_json_backup(sample)
-            
+
+            # Keep ID allocation O(1) for the next sample
+            self._advance_next_id(sample.sample_id)
+
+            # A crash must not lose a sample the GUI reported as saved
+            self.flush()
+
             return True
-            
+
         except Exception as e:
             print(f"Error saving sample: {e}")
             return False
     
+    def save_samples(self, samples: List[SampleData]) -> bool:
+        """Save a batch of samples with one flush
+
+        The timestamp string is built once for the whole batch and the
+        rows go out through a single writerows call, so fixed costs —
+        time formatting, file opens, counter-file rewrites — are paid
+        once instead of once per sample.
+        """
+        try:
+            now = datetime.now().isoformat()
+
+            for sample in samples:
+                sample.calculate_sugar_acid_ratio()
+                if not sample.timestamp:
+                    sample.timestamp = now
+
+                self._save_to_parquet(sample)
+                self._save_to_csv(sample)
+                self._save_to_json_backup(sample)
+                self._advance_next_id(sample.sample_id, persist=False)
+
+            if self._next_id is not None:
+                self._persist_next_id()
+
+            self.flush()
+            return True
+
+        except Exception as e:
+            print(f"Error saving samples: {e}")
+            return False
+
     def _save_to_csv(self, sample: SampleData):
-        """Save sample to CSV file"""
-        file_exists = os.path.exists(self.csv_file)
-        
-        fieldnames = [
-            'sample_id', 'lychee_variation', 'days_after_picked', 
-            'sugar_content', 'acid_content', 'pH', 'sugar_acid_ratio',
-            'notes', 'timestamp', 'rgb_image', 'nir_image',
-            'rgb_processing_settings', 'nir_processing_settings'
-        ]
-        
+        """Stage sample for the CSV file; rows are flushed in batches"""
         # Convert processing settings to JSON strings
         data = sample.to_dict()
         if data['rgb_processing_settings']:
             data['rgb_processing_settings'] = json.dumps(data['rgb_processing_settings'])
         if data['nir_processing_settings']:
             data['nir_processing_settings'] = json.dumps(data['nir_processing_settings'])
-        
-        with open(self.csv_file, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            if not file_exists:
-                writer.writeheader()
-            writer.writerow(data)
-    
+
+        self._pending.append(data)
+        if len(self._pending) >= self._flush_every:
+            self.flush()
+
+    def flush(self):
+        """Write all buffered samples to the CSV and JSON backup
+
+        Batching the writes means one file open and one flush per batch
+        instead of per sample. Read methods call this first, so buffered
+        rows are never invisible to lookups.
+        """
+        if self._pending:
+            pending, self._pending = self._pending, []
+            try:
+                file_exists = os.path.exists(self.csv_file)
+                with open(self.csv_file, 'a', newline='', encoding='utf-8',
+                          buffering=1 << 20) as f:
+                    writer = csv.DictWriter(f, fieldnames=SampleData.FIELDNAMES)
+                    if not file_exists:
+                        writer.writeheader()
+                    writer.writerows(pending)
+            except Exception as e:
+                print(f"Error flushing samples to CSV: {e}")
+                self._pending = pending + self._pending
+
+        self._flush_json_backup()
+
+    def _save_to_parquet(self, sample: SampleData):
+        """Append sample to the Parquet mirror as a single row group
+
+        The writer stays open across saves, so each save costs one small
+        row-group write instead of a full-file rewrite. The mirror gives
+        downstream analysis a columnar, typed copy of the metadata; the
+        CSV remains the authoritative store. Skipped when pyarrow is not
+        installed.
+        """
+        if pq is None:
+            return
+
+        try:
+            if self._parquet_writer is None:
+                self._open_parquet_writer()
+
+            table = pa.Table.from_pylist([_parquet_row(sample.to_dict())],
+                                         schema=self._parquet_arrow_schema)
+            self._parquet_writer.write_table(table)
+        except Exception as e:
+            print(f"Error writing Parquet mirror: {e}")
+
+    def _open_parquet_writer(self):
+        """Open the mirror writer, carrying over rows from earlier sessions"""
+        self._parquet_arrow_schema = _parquet_schema()
+        self._parquet_writer = pq.ParquetWriter(self.parquet_file,
+                                                self._parquet_arrow_schema)
+
+        if os.path.exists(self.csv_file):
+            df = pd.read_csv(self.csv_file)
+            deleted = self._get_deleted_ids()
+            if deleted and 'sample_id' in df.columns:
+                df = df[~df['sample_id'].isin(deleted)]
+            rows = [_parquet_row(row) for row in df.to_dict('records')]
+            if rows:
+                self._parquet_writer.write_table(
+                    pa.Table.from_pylist(rows, schema=self._parquet_arrow_schema))
+
     def _save_to_json_backup(self, sample: SampleData):
-        """Save sample to JSON backup file"""
-        # Load existing data
-        data = []
+        """Stage sample for the JSONL backup; appended on flush
+
+        Re-saving a sample simply appends a newer record; readers take
+        the last record per sample ID, and close() compacts the file.
+        """
+        self._backup_pending.append(sample.to_dict())
+
+    def _flush_json_backup(self):
+        """Append staged backup records to the JSONL file"""
+        if not self._backup_pending:
+            return
+
+        pending, self._backup_pending = self._backup_pending, []
+        try:
+            self._migrate_legacy_backup()
+            with open(self.json_backup_file, 'a', encoding='utf-8') as f:
+                for record in pending:
+                    f.write(_dumps_record(record) + '\n')
+        except Exception as e:
+            print(f"Error appending to JSON backup: {e}")
+            self._backup_pending = pending + self._backup_pending
+
+    def _migrate_legacy_backup(self):
+        """One-time conversion of the old list-style JSON backup to JSONL"""
+        if os.path.exists(self.json_backup_file):
+            return
+
+        legacy_file = os.path.join(self.data_directory, "samples_backup.json")
+        if not os.path.exists(legacy_file):
+            return
+
+        try:
+            with open(legacy_file, 'r', encoding='utf-8') as f:
+                data = _loads_record(f.read())
+            with open(self.json_backup_file, 'w', encoding='utf-8') as f:
+                for record in data:
+                    f.write(_dumps_record(record) + '\n')
+        except Exception as e:
+            print(f"Error migrating JSON backup: {e}")
+
+    def _read_backup_records(self):
+        """Stream the JSONL backup; the last record per sample ID wins
+
+        Returns (records, line_count) where records maps sample ID to the
+        newest record, with tombstoned samples removed.
+        """
+        records = {}
+        line_count = 0
+
         if os.path.exists(self.json_backup_file):
             try:
                 with open(self.json_backup_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-            except:
-                data = []
-        
-        # Add new sample (or update existing)
-        sample_dict = sample.to_dict()
-        
-        # Check if sample already exists and update it
-        existing_index = None
-        for i, existing_sample in enumerate(data):
-            if existing_sample.get('sample_id') == sample.sample_id:
-                existing_index = i
-                break
-        
-        if existing_index is not None:
-            data[existing_index] = sample_dict
-        else:
-            data.append(sample_dict)
-        
-        # Save updated data
-        with open(self.json_backup_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-    
+                    for line in f:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        line_count += 1
+                        try:
+                            record = _loads_record(line)
+                        except ValueError:
+                            continue
+                        if record.get('deleted'):
+                            records.pop(record.get('sample_id'), None)
+                        else:
+                            records[record.get('sample_id')] = record
+            except Exception as e:
+                print(f"Error reading JSON backup: {e}")
+
+        return records, line_count
+
+    def _compact_json_backup(self):
+        """Rewrite the JSONL backup without superseded records"""
+        records, line_count = self._read_backup_records()
+        if line_count <= len(records):
+            return
+
+        try:
+            tmp_file = self.json_backup_file + '.tmp'
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                for record in records.values():
+                    f.write(_dumps_record(record) + '\n')
+            os.replace(tmp_file, self.json_backup_file)
+        except Exception as e:
+            print(f"Error compacting JSON backup: {e}")
+
     def load_sample(self, sample_id: str) -> Optional[SampleData]:
         """Load a specific sample"""
+        self.flush()
+
         if not os.path.exists(self.csv_file):
             return None
         
         try:
-            df = pd.read_csv(self.csv_file)
-            sample_row = df[df['sample_id'] == sample_id]
-            
-            if sample_row.empty:
+            position = self._get_id_index().get(sample_id)
+            if position is None:
                 return None
-            
-            # Convert to dictionary and create sample
-            row_dict = sample_row.iloc[0].to_dict()
-            
-            # Parse JSON settings if they exist
-            if 'rgb_processing_settings' in row_dict and row_dict['rgb_processing_settings']:
-                try:
-                    row_dict['rgb_processing_settings'] = json.loads(row_dict['rgb_processing_settings'])
-                except:
-                    row_dict['rgb_processing_settings'] = None
-            
-            if 'nir_processing_settings' in row_dict and row_dict['nir_processing_settings']:
-                try:
-                    row_dict['nir_processing_settings'] = json.loads(row_dict['nir_processing_settings'])
-                except:
-                    row_dict['nir_processing_settings'] = None
-            
+
+            # Convert to dictionary and create sample; the settings
+            # columns stay as JSON strings and decode lazily on access
+            row_dict = self._get_df().iloc[position].to_dict()
+
             sample = SampleData()
             sample.from_dict(row_dict)
             return sample
@@ -280,31 +736,41 @@ class DataManager:
             print(f"Error loading sample {sample_id}: {e}")
             return None
     
+    def get_all_samples_df(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Get all samples as a DataFrame without building SampleData objects
+
+        Aggregating callers should prefer this over get_all_samples():
+        the settings columns stay as raw JSON strings and no per-row
+        objects are allocated. Optionally restricts to the requested
+        columns. Callers must not mutate the result.
+        """
+        self.flush()
+
+        df = self._get_df()
+        if df is None:
+            return pd.DataFrame()
+
+        if columns is not None:
+            df = df[[column for column in columns if column in df.columns]]
+
+        return df
+
     def get_all_samples(self) -> List[SampleData]:
         """Get all samples"""
+        self.flush()
+
         if not os.path.exists(self.csv_file):
             return []
         
         samples = []
         try:
-            df = pd.read_csv(self.csv_file)
-            
+            df = self._get_df()
+
             for _, row in df.iterrows():
+                # Settings columns stay as JSON strings here; SampleData
+                # decodes them lazily on first access
                 row_dict = row.to_dict()
-                
-                # Parse JSON settings
-                if 'rgb_processing_settings' in row_dict and row_dict['rgb_processing_settings']:
-                    try:
-                        row_dict['rgb_processing_settings'] = json.loads(row_dict['rgb_processing_settings'])
-                    except:
-                        row_dict['rgb_processing_settings'] = None
-                
-                if 'nir_processing_settings' in row_dict and row_dict['nir_processing_settings']:
-                    try:
-                        row_dict['nir_processing_settings'] = json.loads(row_dict['nir_processing_settings'])
-                    except:
-                        row_dict['nir_processing_settings'] = None
-                
+
                 sample = SampleData()
                 sample.from_dict(row_dict)
                 samples.append(sample)
@@ -315,118 +781,258 @@ class DataManager:
         return samples
     
     def delete_sample(self, sample_id: str) -> bool:
-        """Delete a sample and its associated files"""
+        """Delete a sample and its associated files
+
+        The row is tombstoned instead of rewriting the whole CSV: the ID
+        is appended to deleted.txt and filtered out by all read paths.
+        compact() physically rewrites the CSV once tombstones pile up.
+        """
+        return self.delete_samples([sample_id]).get(sample_id, False)
+
+    def delete_samples(self, sample_ids: List[str]) -> Dict[str, bool]:
+        """Delete several samples at once
+
+        The metadata updates (tombstones, cached rows, backup records)
+        happen in a single pass; the image-file unlinks are independent
+        blocking syscalls, so they overlap on a small thread pool.
+        """
+        results = {sample_id: False for sample_id in sample_ids}
+        deleted_now = []
+        paths_to_remove = []
+
         try:
-            if not os.path.exists(self.csv_file):
-                return False
-            
-            # Load existing data
-            df = pd.read_csv(self.csv_file)
-            
-            # Find the sample to get image filenames
-            sample_row = df[df['sample_id'] == sample_id]
-            if sample_row.empty:
-                return False
-            
-            # Get image filenames before deletion
-            rgb_image = sample_row.iloc[0].get('rgb_image')
-            nir_image = sample_row.iloc[0].get('nir_image')
-            
-            # Remove from dataframe
-            df = df[df['sample_id'] != sample_id]
-            
-            # Save updated CSV
-            df.to_csv(self.csv_file, index=False)
-            
-            # Delete image files
-            if rgb_image:
-                rgb_path = os.path.join(self.rgb_image_dir, rgb_image)
-                if os.path.exists(rgb_path):
-                    os.remove(rgb_path)
-            
-            if nir_image:
-                nir_path = os.path.join(self.nir_image_dir, nir_image)
-                if os.path.exists(nir_path):
-                    os.remove(nir_path)
-            
+            for sample_id in sample_ids:
+                sample = self.load_sample(sample_id)
+                if sample is None:
+                    continue
+
+                for image, image_dir in ((sample.rgb_image, self.rgb_image_dir),
+                                         (sample.nir_image, self.nir_image_dir)):
+                    if isinstance(image, str) and image:
+                        paths_to_remove.append(os.path.join(image_dir, image))
+
+                self._get_deleted_ids().add(sample_id)
+                self._backup_pending.append({'sample_id': sample_id,
+                                             'deleted': True})
+                deleted_now.append(sample_id)
+                results[sample_id] = True
+
+            if not deleted_now:
+                return results
+
+            # Persist all tombstones with one append
+            with open(self._deleted_file, 'a') as f:
+                f.write(''.join(sample_id + '\n' for sample_id in deleted_now))
+
+            # Drop the rows from the cached DataFrame in one filter
+            cache = self._df_cache
+            if cache['df'] is not None and 'sample_id' in cache['df'].columns:
+                cache['df'] = cache['df'][
+                    ~cache['df']['sample_id'].isin(deleted_now)]
+                cache['sample_ids'] = None
+                cache['id_index'] = None
+
             # Update JSON backup
-            self._remove_from_json_backup(sample_id)
-            
-            return True
-            
+            self._flush_json_backup()
+
+            # Delete image files in parallel
+            if paths_to_remove:
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    list(executor.map(self._remove_file, paths_to_remove))
+
+            # Physically drop tombstoned rows once enough accumulate
+            self._maybe_compact_csv()
+
         except Exception as e:
-            print(f"Error deleting sample {sample_id}: {e}")
-            return False
-    
-    def _remove_from_json_backup(self, sample_id: str):
-        """Remove sample from JSON backup"""
-        if not os.path.exists(self.json_backup_file):
+            print(f"Error deleting samples: {e}")
+
+        return results
+
+    @staticmethod
+    def _remove_file(path: str):
+        """Remove a file, ignoring ones that are already gone"""
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"Error removing {path}: {e}")
+
+    def compact(self):
+        """Physically rewrite the CSV without tombstoned rows"""
+        if not self._get_deleted_ids():
             return
-        
+
+        self.flush()
+        df = self._get_df()
+
         try:
-            with open(self.json_backup_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # Filter out the sample
-            data = [sample for sample in data if sample.get('sample_id') != sample_id]
-            
-            with open(self.json_backup_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-                
+            if df is not None:
+                df.to_csv(self.csv_file, index=False)
+                self._df_cache['mtime'] = self._csv_mtime()
+                self._df_cache['df'] = df
+
+            self._deleted_ids = set()
+            if os.path.exists(self._deleted_file):
+                os.remove(self._deleted_file)
+
         except Exception as e:
-            print(f"Error updating JSON backup: {e}")
+            print(f"Error compacting CSV: {e}")
+
+    def _maybe_compact_csv(self):
+        """Compact when tombstones exceed ~10% of the live rows"""
+        df = self._df_cache['df']
+        live_rows = len(df) if df is not None else 0
+        dead_rows = len(self._get_deleted_ids())
+
+        if dead_rows >= 16 and dead_rows * 10 >= live_rows:
+            self.compact()
+    
+    def _remove_from_json_backup(self, sample_id: str):
+        """Remove sample from JSON backup by appending a tombstone"""
+        self._backup_pending.append({'sample_id': sample_id, 'deleted': True})
+        self._flush_json_backup()
     
     def export_csv(self, export_path: str) -> bool:
         """Export data to specified CSV file"""
         try:
+            self.flush()
+            self.compact()  # exports must not contain tombstoned rows
+
             if os.path.exists(self.csv_file):
-                import shutil
-                shutil.copy2(self.csv_file, export_path)
+                self._snapshot_file(self.csv_file, export_path)
                 return True
             return False
         except Exception as e:
             print(f"Error exporting CSV: {e}")
             return False
+
+    @staticmethod
+    def _snapshot_file(source: str, destination: str):
+        """Copy a file, preferring an O(1) copy-on-write reflink
+
+        On filesystems with reflink support (Btrfs, XFS) the clone is a
+        single ioctl regardless of file size; everywhere else this falls
+        back to a normal byte copy. A hardlink is deliberately not used:
+        the metadata CSV is appended to and compacted in place, and a
+        hardlinked export would keep changing with it.
+        """
+        if fcntl is not None:
+            try:
+                with open(source, 'rb') as src, open(destination, 'wb') as dst:
+                    fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+                return
+            except OSError:
+                # Cross-device or no reflink support; clean up the empty
+                # destination and fall back to a byte copy
+                try:
+                    os.remove(destination)
+                except OSError:
+                    pass
+
+        shutil.copy2(source, destination)
     
+    def recompute_ratios(self) -> int:
+        """Recompute every sample's sugar/acid ratio in one pass
+
+        Vectorized with numpy over the whole column, for bulk imports
+        where calling the per-sample scalar path N times would dominate.
+        Follows the same rule as calculate_sugar_acid_ratio: the ratio
+        exists only when sugar is non-zero and acid is positive. Returns
+        the number of rows whose ratio changed.
+        """
+        self.flush()
+        df = self._get_df()
+
+        if df is None or df.empty \
+                or 'sugar_content' not in df.columns \
+                or 'acid_content' not in df.columns:
+            return 0
+
+        sugar = pd.to_numeric(df['sugar_content'], errors='coerce').to_numpy()
+        acid = pd.to_numeric(df['acid_content'], errors='coerce').to_numpy()
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            valid = (sugar != 0) & ~np.isnan(sugar) & (acid > 0)
+            ratio = np.where(valid, np.round(sugar / acid, 2), np.nan)
+
+        if 'sugar_acid_ratio' in df.columns:
+            old = pd.to_numeric(df['sugar_acid_ratio'], errors='coerce').to_numpy()
+        else:
+            old = np.full(len(df), np.nan)
+
+        changed = int(np.sum(~((ratio == old) | (np.isnan(ratio) & np.isnan(old)))))
+        if changed == 0:
+            return 0
+
+        df = df.copy()
+        df['sugar_acid_ratio'] = ratio
+
+        try:
+            df.to_csv(self.csv_file, index=False)
+            self._df_cache['df'] = df
+            self._df_cache['mtime'] = self._csv_mtime()
+        except Exception as e:
+            print(f"Error writing recomputed ratios: {e}")
+            return 0
+
+        return changed
+
     def get_statistics(self) -> Dict[str, Any]:
-        """Get dataset statistics"""
-        samples = self.get_all_samples()
-        
-        if not samples:
+        """Get dataset statistics
+
+        Computed with vectorized pandas column operations on the cached
+        DataFrame — no per-row SampleData objects are created.
+        """
+        df = self.get_all_samples_df()
+
+        if df.empty:
             return {}
-        
+
+        def missing_mask(column):
+            """Boolean mask of rows where a column is absent or empty"""
+            if column not in df.columns:
+                return pd.Series(True, index=df.index)
+            values = df[column]
+            return values.isna() | (values == '')
+
         stats = {
-            'total_samples': len(samples),
+            'total_samples': len(df),
             'variations': {},
             'days_distribution': {},
-            'missing_data': {
-                'sugar_content': 0,
-                'acid_content': 0,
-                'pH': 0,
-                'rgb_image': 0,
-                'nir_image': 0
-            },
+            'missing_data': {},
             'complete_samples': 0
         }
-        
-        for sample in samples:
-            # Count variations
-            if sample.lychee_variation:
-                stats['variations'][sample.lychee_variation] = stats['variations'].get(sample.lychee_variation, 0) + 1
-            
-            # Count days
-            if sample.days_after_picked:
-                day_key = f"day_{sample.days_after_picked}"
-                stats['days_distribution'][day_key] = stats['days_distribution'].get(day_key, 0) + 1
-            
-            # Count missing data
-            missing_fields = sample.get_missing_fields()
-            for field in missing_fields:
-                if field in stats['missing_data']:
-                    stats['missing_data'][field] += 1
-            
-            # Count complete samples
-            if sample.is_complete() and not missing_fields:
-                stats['complete_samples'] += 1
-        
+
+        # Count variations
+        if 'lychee_variation' in df.columns:
+            variations = df['lychee_variation'].dropna()
+            variations = variations[variations != '']
+            stats['variations'] = variations.value_counts().to_dict()
+
+        # Count days
+        if 'days_after_picked' in df.columns:
+            days = pd.to_numeric(df['days_after_picked'], errors='coerce')
+            days = days[days.notna() & (days != 0)].astype(int)
+            stats['days_distribution'] = {
+                f"day_{day}": int(count)
+                for day, count in days.value_counts().items()
+            }
+
+        # Count missing data
+        optional_columns = ['sugar_content', 'acid_content', 'pH',
+                            'rgb_image', 'nir_image']
+        optional_missing = {column: missing_mask(column)
+                            for column in optional_columns}
+        stats['missing_data'] = {column: int(mask.sum())
+                                 for column, mask in optional_missing.items()}
+
+        # Count complete samples: all required and optional fields present
+        complete = pd.Series(True, index=df.index)
+        for column in ('sample_id', 'lychee_variation', 'days_after_picked'):
+            complete &= ~missing_mask(column)
+        for mask in optional_missing.values():
+            complete &= ~mask
+        stats['complete_samples'] = int(complete.sum())
+
         return stats
\ No newline at end of file
@@ -4,11 +4,52 @@ Handles sample data entry form and validation
 """
 
 import tkinter as tk
+from contextlib import contextmanager
+from functools import lru_cache
 from tkinter import ttk
 from typing import Callable, Dict, Any, Optional
 
 from ..core.data_manager import SampleData
 
+# Known lychee variation codes, shared across panel instances; the
+# frozenset gives O(1) membership checks for validation
+LYCHEE_VARIATIONS = ('NMZ', 'GW', 'FZX', 'HS', 'HZ', 'BTY', 'JZ')
+LYCHEE_VARIATIONS_SET = frozenset(LYCHEE_VARIATIONS)
+
+# Ratio display values that are not parseable numbers
+_RATIO_SENTINELS = frozenset({"N/A", "Invalid", "∞"})
+
+
+def _display_text(value) -> str:
+    """Field value as entry text: falsy becomes blank, strings pass through
+
+    Sample fields may hold the raw strings the form produced or numbers
+    parsed from the CSV; only the latter need a str() conversion.
+    """
+    if not value:
+        return ""
+    return value if isinstance(value, str) else str(value)
+
+
+@lru_cache(maxsize=256)
+def _compute_ratio(sugar_text: str, acid_text: str) -> str:
+    """Display string for the sugar/acid ratio of two raw field texts
+
+    Pure and memoized: typing, backspacing and retyping revisit the
+    same intermediate strings, so repeated inputs skip the float parses
+    and the formatting.
+    """
+    if not sugar_text or not acid_text:
+        return "N/A"
+    try:
+        sugar = float(sugar_text)
+        acid = float(acid_text)
+    except ValueError:
+        return "Invalid"
+    if acid > 0:
+        return f"{sugar / acid:.2f}"
+    return "∞"
+
 
 class DataEntryPanel:
     """Panel for entering lychee sample data"""
@@ -25,10 +66,44 @@ class DataEntryPanel:
         self.acid_var = tk.StringVar()
         self.ph_var = tk.StringVar()
         self.ratio_var = tk.StringVar(value="N/A")
-        
-        # Status tracking
+
+        # Numeric fields checked by validation, built once
+        self._numeric_fields = (
+            ("Sugar content", self.sugar_var),
+            ("Acid content", self.acid_var),
+            ("pH", self.ph_var),
+        )
+
+        # Status-field lookup: replaces per-call if/elif dispatch
+        self._field_vars = {
+            'variation': self.variation_var,
+            'days': self.days_var,
+            'sugar': self.sugar_var,
+            'acid': self.acid_var,
+            'ph': self.ph_var,
+        }
+
+        # Status tracking; _status_state mirrors what each label shows
+        # so unchanged statuses skip the Tcl config round-trip
         self.status_labels = {}
-        
+        self._status_state = {}
+
+        # Pending after() id for the debounced update chain, and the
+        # suspend flag set while a bulk load is in progress
+        self._pending_update = None
+        self._suspend = False
+
+        # Cached notes text, invalidated via the <<Modified>> event so
+        # get_sample_data doesn't copy the whole buffer through Tcl on
+        # every call
+        self._notes_cache = ""
+        self._notes_dirty = True
+
+        # Reusable SampleData for get_sample_data: every field is
+        # rewritten per call, so one instance serves every flush instead
+        # of allocating a new object per keystroke burst
+        self._sample_scratch = SampleData(initial_sample_id)
+
         # Callbacks
         self.on_data_changed = None
         
@@ -51,32 +126,41 @@ class DataEntryPanel:
         
         # Lychee Variation
         ttk.Label(self.main_frame, text="Lychee Variation:").grid(row=row, column=0, sticky=tk.W, pady=2)
-        self.variation_combo = ttk.Combobox(self.main_frame, textvariable=self.variation_var, 
-                                          values=['NMZ', 'GW', 'FZX', 'HS', 'HZ', 'BTY', 'JZ'])
+        self.variation_combo = ttk.Combobox(self.main_frame, textvariable=self.variation_var,
+                                          values=LYCHEE_VARIATIONS)
         self.variation_combo.grid(row=row, column=1, sticky=(tk.W, tk.E), padx=(10, 0), pady=2)
         row += 1
         
+        # Key-level validators: reject non-numeric input at entry time so
+        # the downstream parses never see malformed text
+        decimal_vcmd = (self.main_frame.register(self._validate_decimal), '%P')
+        integer_vcmd = (self.main_frame.register(self._validate_integer), '%P')
+
         # Days After Picked
         ttk.Label(self.main_frame, text="Days After Picked:").grid(row=row, column=0, sticky=tk.W, pady=2)
-        self.days_spinbox = ttk.Spinbox(self.main_frame, from_=0, to=30, textvariable=self.days_var)
+        self.days_spinbox = ttk.Spinbox(self.main_frame, from_=0, to=30, textvariable=self.days_var,
+                                        validate='key', validatecommand=integer_vcmd)
         self.days_spinbox.grid(row=row, column=1, sticky=(tk.W, tk.E), padx=(10, 0), pady=2)
         row += 1
-        
+
         # Sugar Content
         ttk.Label(self.main_frame, text="Sugar Content (Brix):").grid(row=row, column=0, sticky=tk.W, pady=2)
-        self.sugar_entry = ttk.Entry(self.main_frame, textvariable=self.sugar_var)
+        self.sugar_entry = ttk.Entry(self.main_frame, textvariable=self.sugar_var,
+                                     validate='key', validatecommand=decimal_vcmd)
         self.sugar_entry.grid(row=row, column=1, sticky=(tk.W, tk.E), padx=(10, 0), pady=2)
         row += 1
-        
+
         # Acid Content
         ttk.Label(self.main_frame, text="Acid Content (%):").grid(row=row, column=0, sticky=tk.W, pady=2)
-        self.acid_entry = ttk.Entry(self.main_frame, textvariable=self.acid_var)
+        self.acid_entry = ttk.Entry(self.main_frame, textvariable=self.acid_var,
+                                    validate='key', validatecommand=decimal_vcmd)
         self.acid_entry.grid(row=row, column=1, sticky=(tk.W, tk.E), padx=(10, 0), pady=2)
         row += 1
-        
+
         # pH
         ttk.Label(self.main_frame, text="pH:").grid(row=row, column=0, sticky=tk.W, pady=2)
-        self.ph_entry = ttk.Entry(self.main_frame, textvariable=self.ph_var)
+        self.ph_entry = ttk.Entry(self.main_frame, textvariable=self.ph_var,
+                                  validate='key', validatecommand=decimal_vcmd)
         self.ph_entry.grid(row=row, column=1, sticky=(tk.W, tk.E), padx=(10, 0), pady=2)
         row += 1
         
@@ -101,210 +185,338 @@ class DataEntryPanel:
         # Status indicators
         self.create_status_panel(row)
     
+    # Image rows are built lazily by _ensure_image_row
+    _IMAGE_ROW_LABELS = {'rgb_image': 'RGB Image', 'nir_image': 'NIR Image'}
+
     def create_status_panel(self, row):
-        """Create status indicator panel"""
-        status_frame = ttk.LabelFrame(self.main_frame, text="Data Status", padding="5")
-        status_frame.grid(row=row, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(10, 0))
-        status_frame.columnconfigure(1, weight=1)
-        
-        # Status indicators for each field
+        """Create status indicator panel
+
+        Only the five data-field rows are built up front; the image rows
+        appear on first capture, keeping the startup widget count down
+        for image-less data entry sessions.
+        """
+        self.status_frame = ttk.LabelFrame(self.main_frame, text="Data Status", padding="5")
+        self.status_frame.grid(row=row, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(10, 0))
+        self.status_frame.columnconfigure(1, weight=1)
+
+        # Status indicators for each data field
         fields = [
             ('Variation', 'variation'),
             ('Days After Picked', 'days'),
             ('Sugar Content', 'sugar'),
             ('Acid Content', 'acid'),
             ('pH', 'ph'),
-            ('RGB Image', 'rgb_image'),
-            ('NIR Image', 'nir_image')
         ]
-        
+
+        # Constant grid kwargs built once rather than per widget; kept
+        # for the lazily added image rows
+        self._label_grid = dict(sticky=tk.W, pady=1)
+        self._status_grid = dict(sticky=tk.W, padx=(10, 0), pady=1)
+
         for i, (label_text, field_key) in enumerate(fields):
-            ttk.Label(status_frame, text=f"{label_text}:").grid(row=i, column=0, sticky=tk.W, pady=1)
-            status_label = ttk.Label(status_frame, text="Missing", foreground='red')
-            status_label.grid(row=i, column=1, sticky=tk.W, padx=(10, 0), pady=1)
-            self.status_labels[field_key] = status_label
+            self._add_status_row(i, label_text, field_key)
+
+    def _add_status_row(self, row, label_text, field_key):
+        """Build one label pair in the status panel"""
+        ttk.Label(self.status_frame, text=f"{label_text}:").grid(
+            row=row, column=0, **self._label_grid)
+        status_label = ttk.Label(self.status_frame, text="Missing", foreground='red')
+        status_label.grid(row=row, column=1, **self._status_grid)
+        self.status_labels[field_key] = status_label
+
+    def _ensure_image_row(self, image_type):
+        """Create the status row for an image type on first use"""
+        if image_type in self.status_labels:
+            return
+        self._add_status_row(len(self.status_labels),
+                             self._IMAGE_ROW_LABELS[image_type], image_type)
     
+    @staticmethod
+    def _validate_decimal(proposed):
+        """Accept empty or (partial) decimal input, e.g. "", "-", "12." """
+        if proposed in ("", "-", ".", "-."):
+            return True
+        try:
+            float(proposed)
+        except ValueError:
+            return False
+        return True
+
+    @staticmethod
+    def _validate_integer(proposed):
+        """Accept empty or digits-only input"""
+        return proposed == "" or proposed.isdigit()
+
     def setup_bindings(self):
         """Setup event bindings for automatic updates"""
-        # Bind calculation events
-        self.sugar_var.trace('w', self.calculate_ratio)
-        self.acid_var.trace('w', self.calculate_ratio)
-        
-        # Bind status update events
-        self.variation_var.trace('w', lambda *args: self.update_field_status('variation'))
-        self.days_var.trace('w', lambda *args: self.update_field_status('days'))
-        self.sugar_var.trace('w', lambda *args: self.update_field_status('sugar'))
-        self.acid_var.trace('w', lambda *args: self.update_field_status('acid'))
-        self.ph_var.trace('w', lambda *args: self.update_field_status('ph'))
-        
-        # Bind text widget for notes
-        self.notes_text.bind('<KeyRelease>', self.on_data_change)
-        
-        # Bind other fields
-        for widget in [self.variation_combo, self.days_spinbox, self.sugar_entry, 
-                      self.acid_entry, self.ph_entry]:
-            widget.bind('<KeyRelease>', self.on_data_change)
-            widget.bind('<<ComboboxSelected>>', self.on_data_change)
-    
+        # Every change funnels through one shared bound handler via the
+        # debounced scheduler: a burst of keystrokes collapses into one
+        # ratio + status + callback pass. trace_add is the modern API;
+        # trace() is deprecated and goes through a compatibility shim.
+        for var in [self.variation_var, self.days_var, self.sugar_var,
+                    self.acid_var, self.ph_var]:
+            var.trace_add('write', self._schedule_update)
+
+        # Bind text widget for notes (Text has no variable to trace);
+        # <<Modified>> also covers programmatic edits, unlike KeyRelease
+        self.notes_text.bind('<<Modified>>', self._on_notes_modified)
+
+        # The entry/spinbox widgets already report every change through
+        # their variable traces; per-widget <KeyRelease> bindings would
+        # double-fire the scheduler. Only dropdown selection needs an
+        # explicit event.
+        self.variation_combo.bind('<<ComboboxSelected>>', self._schedule_update)
+
+    def _schedule_update(self, *args):
+        """Debounce form updates: (re)arm a single short after() timer
+
+        Traces fire on every character, but the ratio, status labels and
+        the data-changed callback only need the value at rest, so each
+        write just pushes the flush out another 80 ms.
+        """
+        if self._suspend:
+            return
+        if self._pending_update is not None:
+            self.main_frame.after_cancel(self._pending_update)
+        self._pending_update = self.main_frame.after(80, self._flush_updates)
+
+    def _on_notes_modified(self, event=None):
+        """Mark the notes cache stale and reset Tk's modified flag
+
+        Clearing edit_modified re-fires <<Modified>>, hence the guard on
+        the flag's current value.
+        """
+        if not self.notes_text.edit_modified():
+            return
+        self._notes_dirty = True
+        self.notes_text.edit_modified(False)
+        self._schedule_update()
+
+    @contextmanager
+    def _batch_updates(self, statuses=None):
+        """Suppress per-write updates during a bulk form mutation
+
+        set_sample_data and clear_form write many variables back to
+        back; each write would otherwise arm and re-arm the debounce
+        timer. Inside this context the traces are inert, and one
+        synchronous flush runs on exit. Callers that already know the
+        final field statuses pass them as a dict to spare the flush its
+        read-back of every variable.
+        """
+        self._suspend = True
+        try:
+            yield
+        finally:
+            self._suspend = False
+            if self._pending_update is not None:
+                self.main_frame.after_cancel(self._pending_update)
+            self._flush_updates(statuses)
+
+    def _flush_updates(self, statuses=None):
+        """Run the full update chain once for a burst of changes"""
+        self._pending_update = None
+        self.calculate_ratio()
+        if statuses is None:
+            self.update_all_status()
+        else:
+            # Caller-supplied final state: no .get() round-trips
+            for field_key, present in statuses.items():
+                if present:
+                    self._set_status(field_key, "Entered", 'green')
+                else:
+                    self._set_status(field_key, "Missing", 'red')
+        self.on_data_change()
+
     def grid(self, **kwargs):
         """Grid the main frame"""
         self.main_frame.grid(**kwargs)
     
     def calculate_ratio(self, *args):
         """Calculate sugar/acid ratio automatically"""
-        try:
-            sugar_text = self.sugar_var.get().strip()
-            acid_text = self.acid_var.get().strip()
-            
-            if sugar_text and acid_text:
-                sugar = float(sugar_text)
-                acid = float(acid_text)
-                
-                if acid > 0:
-                    ratio = sugar / acid
-                    self.ratio_var.set(f"{ratio:.2f}")
-                else:
-                    self.ratio_var.set("∞")
-            else:
-                self.ratio_var.set("N/A")
-                
-        except ValueError:
-            self.ratio_var.set("Invalid")
-        
-        self.on_data_change()
-    
+        self.ratio_var.set(_compute_ratio(self.sugar_var.get().strip(),
+                                          self.acid_var.get().strip()))
+
     def update_field_status(self, field_key):
         """Update status indicator for a specific field"""
-        if field_key not in self.status_labels:
+        var = self._field_vars.get(field_key)
+        if var is None:
             return
-        
-        value = ""
-        if field_key == 'variation':
-            value = self.variation_var.get().strip()
-        elif field_key == 'days':
-            value = self.days_var.get().strip()
-        elif field_key == 'sugar':
-            value = self.sugar_var.get().strip()
-        elif field_key == 'acid':
-            value = self.acid_var.get().strip()
-        elif field_key == 'ph':
-            value = self.ph_var.get().strip()
-        
-        if value:
-            self.status_labels[field_key].config(text="Entered", foreground='green')
+
+        if var.get().strip():
+            self._set_status(field_key, "Entered", 'green')
         else:
-            self.status_labels[field_key].config(text="Missing", foreground='red')
-        
-        self.on_data_change()
-    
+            self._set_status(field_key, "Missing", 'red')
+
     def update_image_status(self, image_type: str, captured: bool):
         """Update image capture status"""
-        if image_type in self.status_labels:
-            if captured:
-                self.status_labels[image_type].config(text="Captured", foreground='green')
-            else:
-                self.status_labels[image_type].config(text="Missing", foreground='red')
+        if image_type not in self.status_labels:
+            if not captured or image_type not in self._IMAGE_ROW_LABELS:
+                # No row yet and nothing captured: nothing to show
+                return
+            self._ensure_image_row(image_type)
+        if captured:
+            self._set_status(image_type, "Captured", 'green')
+        else:
+            self._set_status(image_type, "Missing", 'red')
+
+    def _set_status(self, field_key, text, color):
+        """Write a status label, skipping no-op updates
+
+        Steady-state typing re-derives the same "Entered"/green state on
+        every flush; comparing against the remembered state avoids the
+        label.config Tcl call when nothing would change on screen.
+        """
+        label = self.status_labels.get(field_key)
+        if label is None:
+            return
+        state = (text, color)
+        if self._status_state.get(field_key) == state:
+            return
+        self._status_state[field_key] = state
+        label.config(text=text, foreground=color)
     
     def on_data_change(self, event=None):
         """Handle data change events"""
-        if self.on_data_changed:
-            self.on_data_changed(self.get_sample_data())
+        # No listener, no work: skip the SampleData build entirely
+        callback = self.on_data_changed
+        if callback is None:
+            return
+        callback(self.get_sample_data())
     
     def get_sample_data(self) -> SampleData:
-        """Get current sample data"""
-        sample = SampleData(self.sample_id_var.get())
-        sample.lychee_variation = self.variation_var.get().strip()
-        sample.days_after_picked = self.days_var.get().strip() or None
-        sample.sugar_content = self.sugar_var.get().strip() or None
-        sample.acid_content = self.acid_var.get().strip() or None
-        sample.ph = self.ph_var.get().strip() or None
-        sample.notes = self.notes_text.get(1.0, tk.END).strip()
-        
-        # Calculate ratio
+        """Get current sample data
+
+        Returns a shared scratch instance whose every field is
+        rewritten per call; callers must copy it if they keep it past
+        the next form change.
+        """
+        # Snapshot every var once; strip only non-empty values
+        variation = self.variation_var.get()
+        days = self.days_var.get()
+        sugar = self.sugar_var.get()
+        acid = self.acid_var.get()
+        ph = self.ph_var.get()
         ratio_text = self.ratio_var.get()
-        if ratio_text not in ["N/A", "Invalid", "∞"]:
+
+        sample = self._sample_scratch
+        sample.sample_id = self.sample_id_var.get()
+        sample.lychee_variation = variation.strip() if variation else ""
+        sample.days_after_picked = (days.strip() if days else "") or None
+        sample.sugar_content = (sugar.strip() if sugar else "") or None
+        sample.acid_content = (acid.strip() if acid else "") or None
+        sample.ph = (ph.strip() if ph else "") or None
+
+        # Reset the fields the form doesn't own so no state leaks over
+        # from a previous sample
+        sample.sugar_acid_ratio = None
+        sample.timestamp = None
+        sample.rgb_image = None
+        sample.nir_image = None
+        sample.rgb_processing_settings = None
+        sample.nir_processing_settings = None
+
+        if self._notes_dirty:
+            # 'end-1c' skips the Text widget's trailing newline
+            self._notes_cache = self.notes_text.get('1.0', 'end-1c').strip()
+            self._notes_dirty = False
+        sample.notes = self._notes_cache
+
+        # Calculate ratio
+        if ratio_text and ratio_text not in _RATIO_SENTINELS:
             try:
                 sample.sugar_acid_ratio = float(ratio_text)
             except ValueError:
                 sample.sugar_acid_ratio = None
-        
+
         return sample
     
     def set_sample_data(self, sample: SampleData):
         """Load sample data into the form"""
-        self.sample_id_var.set(sample.sample_id or "")
-        self.variation_var.set(sample.lychee_variation or "")
-        self.days_var.set(str(sample.days_after_picked) if sample.days_after_picked else "")
-        self.sugar_var.set(str(sample.sugar_content) if sample.sugar_content else "")
-        self.acid_var.set(str(sample.acid_content) if sample.acid_content else "")
-        self.ph_var.set(str(sample.ph) if sample.ph else "")
-        
-        # Set notes
-        self.notes_text.delete(1.0, tk.END)
-        if sample.notes:
-            self.notes_text.insert(1.0, sample.notes)
-        
-        # Update ratio
+        # Final statuses follow directly from the incoming sample
+        statuses = {
+            'variation': bool(sample.lychee_variation),
+            'days': bool(sample.days_after_picked),
+            'sugar': bool(sample.sugar_content),
+            'acid': bool(sample.acid_content),
+            'ph': bool(sample.ph),
+        }
+        with self._batch_updates(statuses):
+            self.sample_id_var.set(sample.sample_id or "")
+            self.variation_var.set(sample.lychee_variation or "")
+            self.days_var.set(_display_text(sample.days_after_picked))
+            self.sugar_var.set(_display_text(sample.sugar_content))
+            self.acid_var.set(_display_text(sample.acid_content))
+            self.ph_var.set(_display_text(sample.ph))
+
+            # Set notes
+            self.notes_text.delete(1.0, tk.END)
+            if sample.notes:
+                self.notes_text.insert(1.0, sample.notes)
+
+        # The exit flush recalculated the ratio from the text fields; a
+        # stored ratio takes precedence over the recomputed one
         if sample.sugar_acid_ratio:
-            self.ratio_var.set(str(sample.sugar_acid_ratio))
-        else:
-            self.calculate_ratio()
-        
-        # Update status indicators
-        self.update_all_status()
-    
+            self.ratio_var.set(_display_text(sample.sugar_acid_ratio))
+
     def clear_form(self):
         """Clear all form fields"""
-        # self.variation_var.set("")
-        # self.days_var.set("")
-        self.sugar_var.set("")
-        self.acid_var.set("")
-        self.ph_var.set("")
-        self.ratio_var.set("N/A")
-        self.notes_text.delete(1.0, tk.END)
-        
-        # Reset image status
-        self.update_image_status('rgb_image', False)
-        self.update_image_status('nir_image', False)
-        
-        # Update field status
-        self.update_all_status()
+        # Only the cleared fields change status; variation and days are
+        # deliberately kept (see the commented-out resets below)
+        with self._batch_updates({'sugar': False, 'acid': False, 'ph': False}):
+            # self.variation_var.set("")
+            # self.days_var.set("")
+            self.sugar_var.set("")
+            self.acid_var.set("")
+            self.ph_var.set("")
+            self.ratio_var.set("N/A")
+            self.notes_text.delete(1.0, tk.END)
+
+            # Reset image status
+            self.update_image_status('rgb_image', False)
+            self.update_image_status('nir_image', False)
     
     def update_all_status(self):
-        """Update all status indicators"""
-        for field in ['variation', 'days', 'sugar', 'acid', 'ph']:
-            self.update_field_status(field)
+        """Update all field status indicators in one sweep
+
+        Runs from the debounced flush: one pass over the field dict
+        replaces the five per-variable trace dispatches the form used
+        to pay on every keystroke.
+        """
+        for field_key, var in self._field_vars.items():
+            if var.get().strip():
+                self._set_status(field_key, "Entered", 'green')
+            else:
+                self._set_status(field_key, "Missing", 'red')
     
     def set_sample_id(self, sample_id: str):
         """Set the sample ID"""
         self.sample_id_var.set(sample_id)
     
-    def get_validation_errors(self) -> list:
-        """Get list of validation errors"""
-        errors = []
-        
+    def _iter_errors(self):
+        """Yield validation errors lazily, cheapest checks first"""
         if not self.variation_var.get().strip():
-            errors.append("Lychee variation is required")
-        
+            yield "Lychee variation is required"
+
         if not self.days_var.get().strip():
-            errors.append("Days after picked is required")
-        
+            yield "Days after picked is required"
+
         # Validate numeric fields
-        for field_name, var in [("Sugar content", self.sugar_var), 
-                               ("Acid content", self.acid_var), 
-                               ("pH", self.ph_var)]:
+        for field_name, var in self._numeric_fields:
             value = var.get().strip()
             if value:
                 try:
                     float(value)
                 except ValueError:
-                    errors.append(f"{field_name} must be a valid number")
-        
-        return errors
-    
+                    yield f"{field_name} must be a valid number"
+
+    def get_validation_errors(self) -> list:
+        """Get list of validation errors"""
+        return list(self._iter_errors())
+
     def is_valid(self) -> bool:
         """Check if form data is valid"""
-        return len(self.get_validation_errors()) == 0
+        # Stops at the first error: no list build on the common path
+        return next(self._iter_errors(), None) is None
     
     def set_data_changed_callback(self, callback: Callable):
         """Set callback for when data changes"""
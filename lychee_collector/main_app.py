@@ -6,7 +6,14 @@ Coordinates all components and provides the main GUI
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import cv2
+import numpy as np
 import os
+import queue
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional
 
@@ -15,33 +22,104 @@ from .core.data_manager import DataManager, SampleData
 from .gui.camera_panel import CameraPanel
 from .gui.data_entry_panel import DataEntryPanel
 
+# Explicit JPEG encode parameters: quality pinned at 90 (OpenCV's
+# default of 95 encodes noticeably slower for no visible gain) with the
+# Huffman-optimization and progressive passes switched off.
+_JPEG_PARAMS = [cv2.IMWRITE_JPEG_QUALITY, 90,
+                cv2.IMWRITE_JPEG_OPTIMIZE, 0,
+                cv2.IMWRITE_JPEG_PROGRESSIVE, 0]
+
+# PNG with the RLE strategy at low compression: fast lossless encoding
+# for low-complexity frames like the NIR channel.
+_PNG_RLE_PARAMS = [cv2.IMWRITE_PNG_STRATEGY, cv2.IMWRITE_PNG_STRATEGY_RLE,
+                   cv2.IMWRITE_PNG_COMPRESSION, 1]
+
 
 class LycheeDataCollectorApp:
     """Main application class"""
-    
+
+    # Reuse a camera scan finished within this many seconds
+    _CAMERA_SCAN_TTL = 5.0
+
+    # NIR frames are kept lossless — science data shouldn't go through
+    # JPEG's DCT — while RGB stays the smaller lossy JPEG. Set to
+    # '.jpg' to trade fidelity for space.
+    _nir_format = '.png'
+
     def __init__(self, root):
         self.root = root
         self.root.title("Lychee Data Collection Interface")
         self.root.geometry("1600x1000")
         
-        # Core managers
+        # Core managers. CameraManager probes the cameras as it starts,
+        # so that scan seeds the refresh TTL.
         self.camera_manager = CameraManager()
+        self._camera_scan_time = time.monotonic()
         self.data_manager = DataManager()
+
+        # Image directories resolved once; DataManager never moves them
+        self._rgb_dir = self.data_manager.rgb_image_dir
+        self._nir_dir = self.data_manager.nir_image_dir
         
         # GUI components
         self.camera_panel = None
         self.data_panel = None
         
-        # Current sample data
+        # Current sample data. Captured images are held as encoded JPEG
+        # bytes, not raw BGR arrays — the app only ever writes them to
+        # disk, and the bytes are 10-20x smaller than the ndarray.
         self.current_sample = SampleData()
-        self.rgb_image_data = None
-        self.nir_image_data = None
+        self.rgb_image_bytes = None
+        self.nir_image_bytes = None
+
+        # Extension matching what nir_image_bytes actually holds; a
+        # loaded legacy .jpg keeps its extension instead of being
+        # renamed to the capture format with unconverted contents
+        self._nir_ext = self._nir_format
         self.rgb_processing_settings = None
         self.nir_processing_settings = None
-        
+
+        # Dirty bit: set by captures and form edits, cleared by a
+        # successful save, so idempotent re-saves cost nothing
+        self._dirty = True
+
         # Status
         self.status_var = tk.StringVar()
-        
+
+        # Cached sample-ID list; the version counter bumps on every
+        # save/delete so a stale list is never served
+        self._data_version = 0
+        self._sample_ids_cache = None
+        self._stats_cache = None
+
+        # Captured images staged in RAM until the sample is saved, so
+        # retakes overwrite the staged entry instead of hitting disk
+        self._pending_writes = {}
+
+        # (sample_id, bytes) last handed to the writer per channel;
+        # lets save_sample skip re-writing an unchanged image
+        self._rgb_written = None
+        self._nir_written = None
+
+        # Local staging directory: when the dataset lives on networked
+        # or cloud-synced storage, writes land here first and are moved
+        # into place in one step
+        self._stage_dir = tempfile.mkdtemp(prefix='lychee_')
+        self._same_mount = {}
+
+        # Background image writer: disk I/O stays off the Tk thread so
+        # captures are not stalled by JPEG encode + disk latency
+        self._write_q = queue.Queue(maxsize=32)
+        self._writer_thread = threading.Thread(target=self._writer_loop,
+                                               daemon=True)
+        self._writer_thread.start()
+
+        # Background image loader: sample loads read image files off
+        # the Tk thread; the generation token lets a newer load win
+        # over reads still in flight from a previous one
+        self._load_executor = ThreadPoolExecutor(max_workers=2)
+        self._load_generation = 0
+
         # Initialize
         self.setup_ui()
         self.setup_callbacks()
@@ -77,26 +155,32 @@ class LycheeDataCollectorApp:
         """Create control buttons panel"""
         control_frame = ttk.Frame(parent)
         control_frame.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(10, 0))
-        
-        # Control buttons
-        ttk.Button(control_frame, text="Capture All", 
-                  command=self.capture_all_images).grid(row=0, column=0, padx=(0, 5))
-        ttk.Button(control_frame, text="Save Sample", 
-                  command=self.save_sample).grid(row=1, column=0, padx=(0, 5))
-        ttk.Button(control_frame, text="New Sample", 
-                  command=self.new_sample).grid(row=1, column=1, padx=5)
-        ttk.Button(control_frame, text="Load Sample", 
-                  command=self.load_sample).grid(row=1, column=2, padx=5)
-        ttk.Button(control_frame, text="Delete Sample", 
-                  command=self.delete_sample).grid(row=1, column=3, padx=5)
-        ttk.Button(control_frame, text="Export Data", 
-                  command=self.export_data).grid(row=1, column=4, padx=5)
-        ttk.Button(control_frame, text="Statistics", 
-                  command=self.show_statistics).grid(row=1, column=5, padx=5)
-        
-        # Camera detection refresh
-        ttk.Button(control_frame, text="Refresh Cameras", 
-                  command=self.refresh_cameras).grid(row=1, column=6, padx=(20, 0))
+
+        # Control buttons, including the camera detection refresh
+        self._buttons = self._make_buttons(control_frame, (
+            ("Capture All", self.capture_all_images, dict(row=0, column=0, padx=(0, 5))),
+            ("Save Sample", self.save_sample, dict(row=1, column=0, padx=(0, 5))),
+            ("New Sample", self.new_sample, dict(row=1, column=1, padx=5)),
+            ("Load Sample", self.load_sample, dict(row=1, column=2, padx=5)),
+            ("Delete Sample", self.delete_sample, dict(row=1, column=3, padx=5)),
+            ("Export Data", self.export_data, dict(row=1, column=4, padx=5)),
+            ("Statistics", self.show_statistics, dict(row=1, column=5, padx=5)),
+            ("Refresh Cameras", self.refresh_cameras, dict(row=1, column=6, padx=(20, 0))),
+        ))
+
+    @staticmethod
+    def _make_buttons(parent, specs):
+        """Build buttons from (text, command, grid kwargs) specs
+
+        Returns the created buttons keyed by label so callers can still
+        reach individual ones (e.g. to disable them while busy).
+        """
+        buttons = {}
+        for text, command, grid_kwargs in specs:
+            button = ttk.Button(parent, text=text, command=command)
+            button.grid(**grid_kwargs)
+            buttons[text] = button
+        return buttons
     
     def create_status_bar(self):
         """Create status bar"""
@@ -111,13 +195,33 @@ class LycheeDataCollectorApp:
         status_label = ttk.Label(status_frame, textvariable=self.status_var)
         status_label.grid(row=0, column=0, sticky=tk.W, padx=10, pady=5)
         
+        # Unsaved-images indicator
+        self.pending_indicator_var = tk.StringVar()
+        pending_label = ttk.Label(status_frame, textvariable=self.pending_indicator_var, foreground='orange')
+        pending_label.grid(row=0, column=1, sticky=tk.E, padx=10, pady=5)
+
         # Current sample indicator
         self.sample_indicator_var = tk.StringVar()
         sample_label = ttk.Label(status_frame, textvariable=self.sample_indicator_var, foreground='blue')
-        sample_label.grid(row=0, column=1, sticky=tk.E, padx=10, pady=5)
-        
+        sample_label.grid(row=0, column=2, sticky=tk.E, padx=10, pady=5)
+
         status_frame.columnconfigure(0, weight=1)
-    
+
+    def _set_status(self, message):
+        """Set the status bar text only when it actually changes
+
+        Tk re-renders the label on every set, even to the same string;
+        bursts like Capture All would otherwise invalidate it several
+        times in a row.
+        """
+        if self.status_var.get() != message:
+            self.status_var.set(message)
+
+    def _set_sample_indicator(self, message):
+        """Set the current-sample indicator only when it changes"""
+        if self.sample_indicator_var.get() != message:
+            self.sample_indicator_var.set(message)
+
     def setup_callbacks(self):
         """Setup callbacks between components"""
         # Camera capture callbacks
@@ -129,20 +233,24 @@ class LycheeDataCollectorApp:
     
     def on_rgb_captured(self, frame, processing_settings):
         """Handle RGB image capture"""
-        self.rgb_image_data = frame.copy()
+        self.rgb_image_bytes = cv2.imencode('.jpg', frame, _JPEG_PARAMS)[1].tobytes()
         self.rgb_processing_settings = processing_settings
+        self._dirty = True
         self.data_panel.update_image_status('rgb_image', True)
-        self.status_var.set("RGB image captured")
+        self._set_status("RGB image captured")
         
         # Auto-save image
         self.save_rgb_image()
     
     def on_nir_captured(self, frame, processing_settings):
         """Handle NIR image capture"""
-        self.nir_image_data = frame.copy()
+        params = _PNG_RLE_PARAMS if self._nir_format == '.png' else _JPEG_PARAMS
+        self.nir_image_bytes = cv2.imencode(self._nir_format, frame, params)[1].tobytes()
+        self._nir_ext = self._nir_format
         self.nir_processing_settings = processing_settings
+        self._dirty = True
         self.data_panel.update_image_status('nir_image', True)
-        self.status_var.set("NIR image captured")
+        self._set_status("NIR image captured")
         
         # Auto-save image
         self.save_nir_image()
@@ -150,6 +258,7 @@ class LycheeDataCollectorApp:
     def on_data_changed(self, sample_data: SampleData):
         """Handle data entry changes"""
         self.current_sample = sample_data
+        self._dirty = True
     
     def capture_all_images(self):
         """Capture both RGB and NIR images simultaneously"""
@@ -168,49 +277,181 @@ class LycheeDataCollectorApp:
             messagebox.showwarning("Warning", "Please create a new sample first before capturing images.")
             return
         
-        # Capture RGB image if connected
-        if rgb_connected:
+        if rgb_connected and nir_connected:
+            # Release both grabs at the same instant so the RGB/NIR pair
+            # is aligned within driver jitter, instead of the NIR frame
+            # trailing by a full RGB capture. The combined status is
+            # reported once both workers have actually grabbed a frame,
+            # not here — the captures haven't happened yet.
+            barrier = threading.Barrier(2)
+            results = {}
+            results_lock = threading.Lock()
+            for name, panel in (("RGB", self.camera_panel.rgb_panel),
+                                ("NIR", self.camera_panel.nir_panel)):
+                threading.Thread(
+                    target=self._synced_capture,
+                    args=(panel, barrier, name, results, results_lock),
+                    daemon=True).start()
+            return
+        elif rgb_connected:
             self.camera_panel.rgb_panel.capture_image()
-        
-        # Capture NIR image if connected
-        if nir_connected:
+            self._set_status("RGB images captured")
+        elif nir_connected:
             self.camera_panel.nir_panel.capture_image()
-        
-        # Update status
-        captured_images = []
-        if rgb_connected:
-            captured_images.append("RGB")
-        if nir_connected:
-            captured_images.append("NIR")
-        
-        images_str = " and ".join(captured_images)
-        self.status_var.set(f"{images_str} images captured")
-        
+            self._set_status("NIR images captured")
+
         # Show success message
         # messagebox.showinfo("Capture Complete", f"Successfully captured {images_str.lower()} images for sample {self.current_sample.sample_id}")
+
+    def _synced_capture(self, panel, barrier, name, results, results_lock):
+        """Barrier-released worker: grab one frame and hand it to Tk
+
+        capture_frame returns an exclusively owned copy, taken under
+        the processor lock, so the frame cannot be overwritten by the
+        live preview loop while the callback waits in Tk's queue. The
+        callback chain itself touches widgets, so it is marshalled back
+        through after(). The worker that finishes last reports the
+        combined outcome for the status bar.
+        """
+        try:
+            barrier.wait(timeout=2.0)
+        except threading.BrokenBarrierError:
+            pass  # partner missed the rendezvous; capture alone
+        frame = panel.camera_feed.capture_frame(processed=True)
+        if frame is not None and panel.on_image_captured:
+            settings = panel.camera_feed.processor.get_settings_dict()
+            self.root.after(0, panel.on_image_captured, frame, settings)
+        with results_lock:
+            results[name] = frame is not None
+            done = len(results) == 2
+        if done:
+            self.root.after(0, self._report_synced_captures, dict(results))
+
+    def _report_synced_captures(self, results):
+        """Set the status bar once both synced capture workers finished"""
+        captured = [name for name in ("RGB", "NIR") if results.get(name)]
+        failed = [name for name in ("RGB", "NIR") if not results.get(name)]
+        if not failed:
+            self._set_status("RGB and NIR images captured")
+        elif captured:
+            self._set_status(f"{captured[0]} image captured; "
+                             f"{failed[0]} capture failed")
+        else:
+            self._set_status("RGB and NIR capture failed")
     
+    def _writer_loop(self):
+        """Drain queued image writes on the background writer thread"""
+        while True:
+            job = self._write_q.get()
+            if job is None:
+                break
+            filepath, payload = job
+            try:
+                if not isinstance(payload, bytes):
+                    payload = self._encode_image(filepath, payload)
+                self._write_file(filepath, payload)
+            except Exception as e:
+                print(f"Error writing image {filepath}: {e}")
+
+    @staticmethod
+    def _encode_image(filepath, frame, params=None):
+        """Encode a frame in memory for a single buffered write
+
+        cv2.imwrite issues many small unbuffered writes; encoding with
+        imencode and pushing the whole buffer through one file write
+        costs far fewer syscalls, which matters on slow or networked
+        filesystems. JPEGs default to the module's explicit encode
+        parameters rather than inheriting OpenCV's.
+        """
+        ext = os.path.splitext(filepath)[1] or '.jpg'
+        if params is None:
+            if ext == '.jpg':
+                params = _JPEG_PARAMS
+            elif ext == '.png':
+                params = _PNG_RLE_PARAMS
+            else:
+                params = []
+        ok, buf = cv2.imencode(ext, frame, params)
+        if not ok:
+            raise ValueError(f"Could not encode {ext} image")
+        return buf.tobytes()
+
+    def _write_file(self, filepath, data):
+        """Write bytes, staging locally first when the target is remote
+
+        Writing straight to networked or cloud-synced storage pays the
+        remote latency per flush; landing the file in the local staging
+        dir and moving it into place pays it once, and the final path
+        never exposes a partially written image. When the target shares
+        a mount with the staging dir the detour buys nothing, so those
+        writes go direct.
+        """
+        if self._same_device(os.path.dirname(filepath)):
+            with open(filepath, 'wb', buffering=1 << 20) as f:
+                f.write(data)
+            return
+
+        staged = os.path.join(self._stage_dir, os.path.basename(filepath))
+        with open(staged, 'wb', buffering=1 << 20) as f:
+            f.write(data)
+        # shutil.move across mounts degrades to a copy, which would
+        # expose a partial file at the destination while it runs; copy
+        # into a same-directory temp name and publish with an atomic
+        # rename instead
+        tmp = filepath + '.tmp'
+        shutil.move(staged, tmp)
+        os.replace(tmp, filepath)
+
+    def _same_device(self, target_dir):
+        """True when target_dir is on the staging dir's mount (cached)"""
+        same = self._same_mount.get(target_dir)
+        if same is None:
+            try:
+                same = (os.stat(target_dir).st_dev
+                        == os.stat(self._stage_dir).st_dev)
+            except OSError:
+                same = True
+            self._same_mount[target_dir] = same
+        return same
+
     def save_rgb_image(self):
-        """Save RGB image to disk"""
-        if self.rgb_image_data is not None and self.current_sample.sample_id:
-            rgb_dir = self.data_manager.rgb_image_dir
+        """Stage the RGB image for writing when the sample is saved"""
+        if self.rgb_image_bytes is not None and self.current_sample.sample_id:
             filename = f"{self.current_sample.sample_id}_rgb.jpg"
-            filepath = os.path.join(rgb_dir, filename)
-            
-            cv2.imwrite(filepath, self.rgb_image_data)
+            filepath = os.path.join(self._rgb_dir, filename)
+
+            self._pending_writes[filepath] = self.rgb_image_bytes
             self.current_sample.rgb_image = filename
-    
+            self._update_pending_indicator()
+
     def save_nir_image(self):
-        """Save NIR image to disk"""
-        if self.nir_image_data is not None and self.current_sample.sample_id:
-            nir_dir = self.data_manager.nir_image_dir
-            filename = f"{self.current_sample.sample_id}_nir.jpg"
-            filepath = os.path.join(nir_dir, filename)
-            
-            cv2.imwrite(filepath, self.nir_image_data)
+        """Stage the NIR image for writing when the sample is saved"""
+        if self.nir_image_bytes is not None and self.current_sample.sample_id:
+            filename = f"{self.current_sample.sample_id}_nir{self._nir_ext}"
+            filepath = os.path.join(self._nir_dir, filename)
+
+            self._pending_writes[filepath] = self.nir_image_bytes
             self.current_sample.nir_image = filename
+            self._update_pending_indicator()
+
+    def _flush_pending_writes(self):
+        """Hand all staged images to the writer thread"""
+        while self._pending_writes:
+            self._write_q.put(self._pending_writes.popitem())
+        self._update_pending_indicator()
+
+    def _update_pending_indicator(self):
+        """Reflect the staged-image count in the status bar"""
+        count = len(self._pending_writes)
+        self.pending_indicator_var.set(f"{count} unsaved image(s)" if count else "")
     
     def save_sample(self):
         """Save current sample"""
+        # Nothing changed since the last save — skip the whole path
+        if not self._dirty:
+            self._set_status(f"No changes for {self.current_sample.sample_id}")
+            return
+
         # Validate form
         errors = self.data_panel.get_validation_errors()
         if errors:
@@ -218,11 +459,13 @@ class LycheeDataCollectorApp:
             messagebox.showerror("Validation Error", error_msg)
             return
         
-        # Check for missing images and warn user
+        # Check for missing images and warn user. A recorded filename
+        # counts as present even without bytes: background loads from
+        # load_sample may still be in flight when the user hits save.
         missing_images = []
-        if self.rgb_image_data is None:
+        if self.rgb_image_bytes is None and not self.current_sample.rgb_image:
             missing_images.append("RGB image")
-        if self.nir_image_data is None:
+        if self.nir_image_bytes is None and not self.current_sample.nir_image:
             missing_images.append("NIR image")
         
         if missing_images:
@@ -244,24 +487,43 @@ class LycheeDataCollectorApp:
         sample.rgb_processing_settings = self.rgb_processing_settings
         sample.nir_processing_settings = self.nir_processing_settings
         
-        # Add image filenames
-        if self.rgb_image_data is not None:
+        # Add image filenames. When bytes are absent but the loaded
+        # sample recorded a filename, carry it over so an edit saved
+        # before the loader pool finishes doesn't drop the image columns.
+        if self.rgb_image_bytes is not None:
             sample.rgb_image = f"{sample.sample_id}_rgb.jpg"
-        if self.nir_image_data is not None:
-            sample.nir_image = f"{sample.sample_id}_nir.jpg"
-        
-        # Save images if not already saved
-        if self.rgb_image_data is not None:
-            self.save_rgb_image()
-        if self.nir_image_data is not None:
-            self.save_nir_image()
-        
+        elif self.current_sample.rgb_image:
+            sample.rgb_image = self.current_sample.rgb_image
+        if self.nir_image_bytes is not None:
+            sample.nir_image = f"{sample.sample_id}_nir{self._nir_ext}"
+        elif self.current_sample.nir_image:
+            sample.nir_image = self.current_sample.nir_image
+
+        # Stage images, skipping any whose exact bytes already went to
+        # the writer for this sample ID — each capture swaps in a fresh
+        # bytes object, so identity is a reliable change check
+        if self.rgb_image_bytes is not None:
+            written = self._rgb_written
+            if not (written and written[0] == sample.sample_id
+                    and written[1] is self.rgb_image_bytes):
+                self.save_rgb_image()
+                self._rgb_written = (sample.sample_id, self.rgb_image_bytes)
+        if self.nir_image_bytes is not None:
+            written = self._nir_written
+            if not (written and written[0] == sample.sample_id
+                    and written[1] is self.nir_image_bytes):
+                self.save_nir_image()
+                self._nir_written = (sample.sample_id, self.nir_image_bytes)
+        self._flush_pending_writes()
+
         # Save to database
         if self.data_manager.save_sample(sample):
+            self._data_version += 1
+            self._dirty = False
             success_msg = f"Sample {sample.sample_id} saved successfully"
             if missing_images:
                 success_msg += f"\n\nNote: Remember to capture the {' and '.join(missing_images)} later."
-            self.status_var.set(f"Sample {sample.sample_id} saved successfully")
+            self._set_status(f"Sample {sample.sample_id} saved successfully")
             # messagebox.showinfo("Success", success_msg)
         else:
             messagebox.showerror("Error", "Failed to save sample")
@@ -277,20 +539,29 @@ class LycheeDataCollectorApp:
         
         # Reset sample data
         self.current_sample = SampleData(next_id)
-        self.rgb_image_data = None
-        self.nir_image_data = None
+        self.rgb_image_bytes = None
+        self.nir_image_bytes = None
+        self._nir_ext = self._nir_format
         self.rgb_processing_settings = None
         self.nir_processing_settings = None
         
         # Update indicators
-        self.sample_indicator_var.set(f"Current: {next_id}")
-        self.status_var.set("New sample ready")
+        self._set_sample_indicator(f"Current: {next_id}")
+        self._set_status("New sample ready")
     
+    def _get_sample_ids(self):
+        """Sample-ID list, cached until a save or delete invalidates it"""
+        if (self._sample_ids_cache is None
+                or self._sample_ids_cache[0] != self._data_version):
+            self._sample_ids_cache = (self._data_version,
+                                      self.data_manager.get_all_sample_ids())
+        return self._sample_ids_cache[1]
+
     def load_sample(self):
         """Load an existing sample"""
         # Get all sample IDs
-        sample_ids = self.data_manager.get_all_sample_ids()
-        
+        sample_ids = self._get_sample_ids()
+
         if not sample_ids:
             messagebox.showinfo("Info", "No samples found")
             return
@@ -307,32 +578,70 @@ class LycheeDataCollectorApp:
                 
                 # Load images if they exist
                 self.load_sample_images(sample)
-                
-                self.sample_indicator_var.set(f"Current: {selected_id}")
-                self.status_var.set(f"Sample {selected_id} loaded")
+
+                # The form now mirrors what is already on disk
+                self._dirty = False
+
+                self._set_sample_indicator(f"Current: {selected_id}")
+                self._set_status(f"Sample {selected_id} loaded")
             else:
                 messagebox.showerror("Error", f"Could not load sample {selected_id}")
     
     def load_sample_images(self, sample: SampleData):
-        """Load sample images if they exist"""
-        # Load RGB image
+        """Load sample images in the background if they exist
+
+        Loaded images are only ever re-written to disk, never shown or
+        reprocessed, so the already-encoded file bytes are kept as-is —
+        no JPEG decode needed. The reads run on the loader pool and the
+        results are marshalled back via after(), so "Load Sample"
+        returns immediately.
+        """
+        self._load_generation += 1
+        generation = self._load_generation
+
+        # Load RGB image. No exists() probe first: the worker's open()
+        # already handles a missing file, and stat+open is two
+        # filesystem round-trips where one will do.
         if sample.rgb_image:
-            rgb_path = os.path.join(self.data_manager.rgb_image_dir, sample.rgb_image)
-            if os.path.exists(rgb_path):
-                self.rgb_image_data = cv2.imread(rgb_path)
-                self.data_panel.update_image_status('rgb_image', True)
-        
+            rgb_path = os.path.join(self._rgb_dir, sample.rgb_image)
+            self._load_executor.submit(self._load_image_file,
+                                       rgb_path, 'rgb_image', generation)
+
         # Load NIR image
         if sample.nir_image:
-            nir_path = os.path.join(self.data_manager.nir_image_dir, sample.nir_image)
-            if os.path.exists(nir_path):
-                self.nir_image_data = cv2.imread(nir_path)
-                self.data_panel.update_image_status('nir_image', True)
+            nir_path = os.path.join(self._nir_dir, sample.nir_image)
+            self._load_executor.submit(self._load_image_file,
+                                       nir_path, 'nir_image', generation)
         
         # Load processing settings
         self.rgb_processing_settings = sample.rgb_processing_settings
         self.nir_processing_settings = sample.nir_processing_settings
-    
+
+    def _load_image_file(self, filepath, image_type, generation):
+        """Loader-pool worker: read one image file and hand it back"""
+        try:
+            with open(filepath, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            return  # recorded filename with no file is a valid state
+        except OSError as e:
+            print(f"Error loading image {filepath}: {e}")
+            return
+        self.root.after(0, self._on_image_loaded,
+                        image_type, data, filepath, generation)
+
+    def _on_image_loaded(self, image_type, data, filepath, generation):
+        """Store a background-loaded image unless a newer load started"""
+        if generation != self._load_generation:
+            return
+        if image_type == 'rgb_image':
+            self.rgb_image_bytes = data
+        else:
+            self.nir_image_bytes = data
+            # Loaded bytes stay in whatever format they were saved in
+            self._nir_ext = os.path.splitext(filepath)[1] or self._nir_format
+        self.data_panel.update_image_status(image_type, True)
+
     def delete_sample(self):
         """Delete current sample"""
         if not self.current_sample.sample_id:
@@ -346,7 +655,8 @@ class LycheeDataCollectorApp:
         
         if result:
             if self.data_manager.delete_sample(self.current_sample.sample_id):
-                self.status_var.set(f"Sample {self.current_sample.sample_id} deleted")
+                self._data_version += 1
+                self._set_status(f"Sample {self.current_sample.sample_id} deleted")
                 self.new_sample()  # Start fresh
             else:
                 messagebox.showerror("Error", "Failed to delete sample")
@@ -367,27 +677,72 @@ class LycheeDataCollectorApp:
                 messagebox.showerror("Error", "Failed to export data")
     
     def show_statistics(self):
-        """Show dataset statistics"""
-        stats = self.data_manager.get_statistics()
-        
-        if not stats:
-            messagebox.showinfo("Statistics", "No data available")
-            return
-        
+        """Show dataset statistics
+
+        The formatted report is cached against the data version, so
+        repeat clicks without an intervening save or delete skip both
+        the statistics scan and the formatting pass.
+        """
+        if self._stats_cache is None or self._stats_cache[0] != self._data_version:
+            stats = self.data_manager.get_statistics()
+
+            if not stats:
+                messagebox.showinfo("Statistics", "No data available")
+                return
+
+            self._stats_cache = (self._data_version,
+                                 StatisticsDialog.format_statistics(stats))
+
         # Create statistics dialog
-        StatisticsDialog(self.root, stats)
+        StatisticsDialog(self.root, self._stats_cache[1])
     
     def refresh_cameras(self):
-        """Refresh camera detection"""
+        """Refresh camera detection on a background thread
+
+        Probing absent camera indices can block for seconds apiece, so
+        the scan runs off the Tk thread with the button disabled to
+        prevent re-entry; a scan that finished within the TTL is
+        reused instead of probing again.
+        """
+        if time.monotonic() - self._camera_scan_time < self._CAMERA_SCAN_TTL:
+            available = self.camera_manager.available_cameras
+            self._set_status(f"Cameras refreshed - Available: {available}")
+            return
+
+        button = self._buttons.get("Refresh Cameras")
+        if button is not None:
+            button.config(state=tk.DISABLED)
+        self._set_status("Refreshing cameras...")
+        threading.Thread(target=self._refresh_cameras_worker,
+                         daemon=True).start()
+
+    def _refresh_cameras_worker(self):
+        """Run the camera scan and marshal the result back to Tk"""
         self.camera_manager.detect_cameras()
+        self.root.after(0, self._on_cameras_refreshed)
+
+    def _on_cameras_refreshed(self):
+        """Re-enable the refresh button and report the scan result"""
+        self._camera_scan_time = time.monotonic()
+        button = self._buttons.get("Refresh Cameras")
+        if button is not None:
+            button.config(state=tk.NORMAL)
         available = self.camera_manager.available_cameras
-        self.status_var.set(f"Cameras refreshed - Available: {available}")
+        self._set_status(f"Cameras refreshed - Available: {available}")
     
     def on_closing(self):
         """Handle application closing"""
         # Cleanup cameras
         self.camera_panel.cleanup()
-        
+
+        # Stop the loader pool and let the writer thread finish any
+        # queued image writes
+        self._load_executor.shutdown(wait=False)
+        self._flush_pending_writes()
+        self._write_q.put(None)
+        self._writer_thread.join()
+        shutil.rmtree(self._stage_dir, ignore_errors=True)
+
         # Close window
         self.root.destroy()
 
@@ -419,9 +774,9 @@ class SampleSelectionDialog:
         self.listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        # Add samples to listbox
-        for sample_id in reversed(sample_ids):  # Most recent first
-            self.listbox.insert(0, sample_id)
+        # Add samples to listbox, most recent first. One bulk insert is
+        # a single Tcl call; inserting at index 0 in a loop is O(N^2).
+        self.listbox.insert(tk.END, *reversed(sample_ids))
         
         # Buttons
         button_frame = ttk.Frame(self.dialog)
@@ -457,7 +812,7 @@ class SampleSelectionDialog:
 class StatisticsDialog:
     """Dialog for displaying dataset statistics"""
     
-    def __init__(self, parent, stats):
+    def __init__(self, parent, stats_text):
         # Create dialog
         self.dialog = tk.Toplevel(parent)
         self.dialog.title("Dataset Statistics")
@@ -477,8 +832,7 @@ class StatisticsDialog:
         text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        # Format and insert statistics
-        stats_text = self.format_statistics(stats)
+        # Insert pre-formatted statistics
         text_widget.insert(tk.END, stats_text)
         text_widget.config(state=tk.DISABLED)
         
@@ -491,37 +845,45 @@ class StatisticsDialog:
         y = (self.dialog.winfo_screenheight() // 2) - (self.dialog.winfo_height() // 2)
         self.dialog.geometry(f"+{x}+{y}")
     
-    def format_statistics(self, stats):
-        """Format statistics for display"""
-        text = "LYCHEE DATASET STATISTICS\n"
-        text += "=" * 50 + "\n\n"
-        
-        text += f"Total Samples: {stats.get('total_samples', 0)}\n"
-        text += f"Complete Samples: {stats.get('complete_samples', 0)}\n\n"
-        
+    @staticmethod
+    def format_statistics(stats):
+        """Format statistics for display
+
+        Built as a list of parts joined once at the end — repeated
+        string += reallocates the whole report per line, which gets
+        quadratic as the distribution tables grow.
+        """
+        parts = ["LYCHEE DATASET STATISTICS\n"]
+        parts.append("=" * 50 + "\n\n")
+
+        total = stats.get('total_samples', 0)
+        parts.append(f"Total Samples: {total}\n")
+        parts.append(f"Complete Samples: {stats.get('complete_samples', 0)}\n\n")
+
         # Variations
-        text += "Lychee Variations:\n"
-        text += "-" * 20 + "\n"
+        parts.append("Lychee Variations:\n")
+        parts.append("-" * 20 + "\n")
         for variation, count in stats.get('variations', {}).items():
-            text += f"  {variation}: {count} samples\n"
-        text += "\n"
-        
+            parts.append(f"  {variation}: {count} samples\n")
+        parts.append("\n")
+
         # Days distribution
-        text += "Days After Harvest Distribution:\n"
-        text += "-" * 35 + "\n"
+        parts.append("Days After Harvest Distribution:\n")
+        parts.append("-" * 35 + "\n")
         for day, count in sorted(stats.get('days_distribution', {}).items()):
-            text += f"  {day.replace('_', ' ').title()}: {count} samples\n"
-        text += "\n"
-        
-        # Missing data
-        text += "Missing Data Summary:\n"
-        text += "-" * 25 + "\n"
-        for field, missing_count in stats.get('missing_data', {}).items():
-            total = stats.get('total_samples', 0)
-            percentage = (missing_count / total * 100) if total > 0 else 0
-            text += f"  {field.replace('_', ' ').title()}: {missing_count}/{total} ({percentage:.1f}%)\n"
-        
-        return text
+            parts.append(f"  {day.replace('_', ' ').title()}: {count} samples\n")
+        parts.append("\n")
+
+        # Missing data: percentages for all fields in one vector op
+        parts.append("Missing Data Summary:\n")
+        parts.append("-" * 25 + "\n")
+        missing = stats.get('missing_data', {})
+        counts = np.fromiter(missing.values(), dtype=np.int64, count=len(missing))
+        percentages = counts * (100.0 / total) if total > 0 else np.zeros(len(missing))
+        for (field, missing_count), percentage in zip(missing.items(), percentages):
+            parts.append(f"  {field.replace('_', ' ').title()}: {missing_count}/{total} ({percentage:.1f}%)\n")
+
+        return "".join(parts)
 
 
 def main():